@@ -14,13 +14,24 @@ function doGet(e) {
       return createResponse({error: 'Worksheet not found'}, 404);
     }
 
+    // metaOnly=true: 셀 값을 읽지 않고 크기와 쓰기 가능 여부만 반환
+    if (e.parameter.metaOnly === 'true') {
+      return createResponse({
+        success: true,
+        rows: worksheet.getLastRow(),
+        columns: worksheet.getLastColumn(),
+        writable: isWorksheetWritable(worksheet)
+      });
+    }
+
     var data = worksheet.getDataRange().getValues();
 
     return createResponse({
       success: true,
       data: data,
       rows: data.length,
-      columns: data[0] ? data[0].length : 0
+      columns: data[0] ? data[0].length : 0,
+      writable: isWorksheetWritable(worksheet)
     });
 
   } catch (error) {
@@ -30,7 +41,7 @@ function doGet(e) {
 
 function doPost(e) {
   try {
-    var requestData = JSON.parse(e.postData.contents);
+    var requestData = JSON.parse(readPostBody(e));
     var sheetId = requestData.sheetId;
     var sheetName = requestData.sheetName || 'Sheet1';
     var action = requestData.action;
@@ -44,8 +55,8 @@ function doPost(e) {
     var sheet = SpreadsheetApp.openById(sheetId);
     var worksheet = null;
 
-    // 시트 생성 및 시트 목록 조회의 경우 worksheet가 null이어도 됨
-    if (action !== 'create_sheet' && action !== 'get_sheet_names') {
+    // 시트 생성, 시트 목록 조회, 일괄 작업의 경우 worksheet가 null이어도 됨
+    if (action !== 'create_sheet' && action !== 'get_sheet_names' && action !== 'batch') {
       worksheet = sheet.getSheetByName(sheetName);
       if (!worksheet) {
         return createResponse({error: 'Worksheet not found'}, 404);
@@ -66,9 +77,7 @@ function doPost(e) {
 
       case 'append':
         if (data && Array.isArray(data)) {
-          data.forEach(function(row) {
-            worksheet.appendRow(row);
-          });
+          appendRowsBulk(worksheet, data);
           result = {success: true, action: 'appended', rows: data.length};
         } else {
           return createResponse({error: 'data array required for append'}, 400);
@@ -115,8 +124,35 @@ function doPost(e) {
         result = {success: true, action: 'get_sheet_names', sheet_names: sheetNames, count: sheetNames.length};
         break;
 
+      case 'batch':
+        var ops = requestData.ops;
+        if (!ops || !Array.isArray(ops)) {
+          return createResponse({error: 'ops array required for batch'}, 400);
+        }
+
+        // 여러 쓰기 작업을 한 번의 실행에서 처리하고 마지막에 한 번만 flush
+        // 작업별로 예외를 잡아 4xx로 응답: 바깥 catch(500)로 빠지면 클라이언트가
+        // 이미 적용된 작업까지 포함해 배치 전체를 재전송하므로 중복 기록이 생김
+        var opResults = [];
+        for (var i = 0; i < ops.length; i++) {
+          var opResult;
+          try {
+            opResult = applyBatchOp(sheet, ops[i]);
+          } catch (opError) {
+            opResult = {error: opError.toString()};
+          }
+          opResults.push(opResult);
+          if (opResult.error) {
+            SpreadsheetApp.flush();
+            return createResponse({error: 'batch op ' + i + ' failed: ' + opResult.error, results: opResults}, 400);
+          }
+        }
+        SpreadsheetApp.flush();
+        result = {success: true, action: 'batch', count: opResults.length, results: opResults};
+        break;
+
       default:
-        return createResponse({error: 'Invalid action. Use: update, append, clear, overwrite, create_sheet, get_sheet_names'}, 400);
+        return createResponse({error: 'Invalid action. Use: update, append, clear, overwrite, create_sheet, get_sheet_names, batch'}, 400);
     }
 
     return createResponse(result);
@@ -126,6 +162,104 @@ function doPost(e) {
   }
 }
 
+// 여러 행을 마지막 행 뒤에 한 번의 setValues로 추가 (행마다 appendRow 호출 시 대량 데이터에서 실행 시간 초과)
+function appendRowsBulk(worksheet, rows) {
+  if (rows.length === 0) {
+    return;
+  }
+
+  var width = 0;
+  rows.forEach(function(row) {
+    width = Math.max(width, row.length);
+  });
+  if (width === 0) {
+    return;
+  }
+
+  // setValues는 모든 행의 길이가 같아야 하므로 짧은 행은 빈 값으로 채움
+  var values = rows.map(function(row) {
+    if (row.length === width) {
+      return row;
+    }
+    var padded = row.slice();
+    while (padded.length < width) {
+      padded.push('');
+    }
+    return padded;
+  });
+
+  var startRow = worksheet.getLastRow() + 1;
+  var missingRows = startRow + values.length - 1 - worksheet.getMaxRows();
+  if (missingRows > 0) {
+    worksheet.insertRowsAfter(worksheet.getMaxRows(), missingRows);
+  }
+  var missingColumns = width - worksheet.getMaxColumns();
+  if (missingColumns > 0) {
+    worksheet.insertColumnsAfter(worksheet.getMaxColumns(), missingColumns);
+  }
+
+  worksheet.getRange(startRow, 1, values.length, width).setValues(values);
+}
+
+// 요청 본문 읽기 (contentEncoding=gzip이면 base64로 감싼 gzip 본문을 복원)
+function readPostBody(e) {
+  if (e.parameter && e.parameter.contentEncoding === 'gzip') {
+    var compressed = Utilities.newBlob(Utilities.base64Decode(e.postData.contents), 'application/x-gzip');
+    return Utilities.ungzip(compressed).getDataAsString('UTF-8');
+  }
+  return e.postData.contents;
+}
+
+// batch 액션의 개별 쓰기 작업 처리 (update, append, clear, overwrite)
+function applyBatchOp(sheet, op) {
+  var worksheet = sheet.getSheetByName(op.sheetName || 'Sheet1');
+  if (!worksheet) {
+    return {error: 'Worksheet not found'};
+  }
+
+  switch (op.action) {
+    case 'update':
+      if (!op.range || !op.data) {
+        return {error: 'range and data required for update'};
+      }
+      worksheet.getRange(op.range).setValues(op.data);
+      return {success: true, action: 'updated', range: op.range};
+
+    case 'append':
+      if (!op.data || !Array.isArray(op.data)) {
+        return {error: 'data array required for append'};
+      }
+      appendRowsBulk(worksheet, op.data);
+      return {success: true, action: 'appended', rows: op.data.length};
+
+    case 'clear':
+      if (op.range) {
+        worksheet.getRange(op.range).clear();
+        return {success: true, action: 'cleared', range: op.range};
+      }
+      worksheet.clear();
+      return {success: true, action: 'cleared', range: 'all'};
+
+    case 'overwrite':
+      worksheet.clear();
+      if (op.data && op.data.length > 0) {
+        worksheet.getRange(1, 1, op.data.length, op.data[0].length).setValues(op.data);
+      }
+      return {success: true, action: 'overwritten', rows: op.data ? op.data.length : 0};
+
+    default:
+      return {error: 'Invalid batch action: ' + op.action};
+  }
+}
+
+// 시트 보호 설정을 확인해 쓰기 가능 여부 반환 (데이터를 변경하지 않음)
+function isWorksheetWritable(worksheet) {
+  var protections = worksheet.getProtections(SpreadsheetApp.ProtectionType.SHEET);
+  return protections.every(function(protection) {
+    return protection.canEdit();
+  });
+}
+
 function createResponse(data, statusCode) {
   statusCode = statusCode || 200;
 
@@ -38,7 +38,7 @@ function doGet(e) {
 
 function doPost(e) {
   try {
-    var requestData = JSON.parse(e.postData.contents);
+    var requestData = JSON.parse(readPostBody(e));
 
     // 토큰 검증
     if (!validateToken(requestData.token)) {
@@ -76,9 +76,7 @@ function doPost(e) {
 
       case 'append':
         if (data && Array.isArray(data)) {
-          data.forEach(function(row) {
-            worksheet.appendRow(row);
-          });
+          appendRowsBulk(worksheet, data);
           result = {success: true, action: 'appended', rows: data.length};
         } else {
           return createResponse({error: 'data array required for append'}, 400);
@@ -114,6 +112,54 @@ function doPost(e) {
   }
 }
 
+// 여러 행을 마지막 행 뒤에 한 번의 setValues로 추가 (행마다 appendRow 호출 시 대량 데이터에서 실행 시간 초과)
+function appendRowsBulk(worksheet, rows) {
+  if (rows.length === 0) {
+    return;
+  }
+
+  var width = 0;
+  rows.forEach(function(row) {
+    width = Math.max(width, row.length);
+  });
+  if (width === 0) {
+    return;
+  }
+
+  // setValues는 모든 행의 길이가 같아야 하므로 짧은 행은 빈 값으로 채움
+  var values = rows.map(function(row) {
+    if (row.length === width) {
+      return row;
+    }
+    var padded = row.slice();
+    while (padded.length < width) {
+      padded.push('');
+    }
+    return padded;
+  });
+
+  var startRow = worksheet.getLastRow() + 1;
+  var missingRows = startRow + values.length - 1 - worksheet.getMaxRows();
+  if (missingRows > 0) {
+    worksheet.insertRowsAfter(worksheet.getMaxRows(), missingRows);
+  }
+  var missingColumns = width - worksheet.getMaxColumns();
+  if (missingColumns > 0) {
+    worksheet.insertColumnsAfter(worksheet.getMaxColumns(), missingColumns);
+  }
+
+  worksheet.getRange(startRow, 1, values.length, width).setValues(values);
+}
+
+// 요청 본문 읽기 (contentEncoding=gzip이면 base64로 감싼 gzip 본문을 복원)
+function readPostBody(e) {
+  if (e.parameter && e.parameter.contentEncoding === 'gzip') {
+    var compressed = Utilities.newBlob(Utilities.base64Decode(e.postData.contents), 'application/x-gzip');
+    return Utilities.ungzip(compressed).getDataAsString('UTF-8');
+  }
+  return e.postData.contents;
+}
+
 function validateToken(providedToken) {
   // 유효한 토큰 목록 (여러 개 설정 가능)
   var validTokens = [
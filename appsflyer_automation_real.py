@@ -235,11 +235,13 @@ class AppsflyerRealDataAutomation:
             for grade, count in grade_dist.items():
                 print(f"  {grade}등급: {count:,}개")
 
-        # 상위 성과자
-        top_performers = stats.get('top_performers', [])
-        if top_performers:
+        # 상위 성과자 (컬럼별 배열 형식)
+        top_performers = stats.get('top_performers', {})
+        top_count = min(5, len(top_performers.get('content_name', [])))
+        if top_count:
             print(f"\n🥇 상위 성과 광고 (Top 5):")
-            for i, performer in enumerate(top_performers[:5], 1):
+            for i in range(1, top_count + 1):
+                performer = {col: values[i - 1] for col, values in top_performers.items()}
                 cac = performer.get('d1_retained_cac', 0)
                 cac_str = f"${cac:.2f}" if cac != float('inf') else "N/A"
                 cost = performer.get('cost', 0)
@@ -27,6 +27,12 @@ setup(
     python_requires=">=3.7",
     install_requires=[
         "requests>=2.28.0",
+        "urllib3>=1.26.0",
         "python-dotenv>=0.19.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.6.0"],
+        "http2": ["httpx[http2]>=0.24.0"],
+        "parquet": ["pyarrow>=10.0.0"],
+    },
 )
\ No newline at end of file
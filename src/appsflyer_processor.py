@@ -379,6 +379,20 @@ class AppsflyerDataProcessor:
         logger.info(f"처리된 데이터 CSV 저장 완료: {output_path}")
         return output_path
 
+    def export_to_parquet(self, output_path: str) -> str:
+        """
+        처리된 데이터를 Parquet으로 내보내기 (pyarrow 필요)
+
+        컬럼 단위로 기록하고 zstd로 압축하므로 CSV보다 쓰기가 빠르고
+        파일도 작습니다. 엑셀에서 열어볼 파일은 export_to_csv를 사용하세요.
+        """
+        if self.processed_data is None:
+            raise ValueError("처리된 데이터가 없습니다. process() 메서드를 먼저 실행하세요.")
+
+        self.processed_data.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+        logger.info(f"처리된 데이터 Parquet 저장 완료: {output_path}")
+        return output_path
+
 
 # 유틸리티 함수
 import re
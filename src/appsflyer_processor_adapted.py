@@ -14,6 +14,58 @@ import re
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 광고명 키워드 규칙: 특성별 (값, 키워드 목록)을 우선순위 순서로 정의
+AD_NAME_RULES = {
+    'media_type': [
+        ('tiktok', ['ttcx', 'tiktok']),
+        ('meta', ['meta', 'facebook', 'instagram']),
+        ('echo', ['echo']),            # Echo 매체로 추정
+        ('spoon', ['spoon']),          # Spoon 매체로 추정
+        ('innoceans', ['innoceans'])   # Innoceans 매체로 추정
+    ],
+    'content_theme': [
+        ('participation', ['participation']),
+        ('blinddate', ['blinddate']),
+        ('interest', ['interest']),
+        ('tpo', ['tpo'])
+    ],
+    'creative_type': [
+        ('video', ['vdo', 'video']),
+        ('image', ['img', 'image'])
+    ]
+}
+
+# 키워드가 없을 때의 기본값
+AD_NAME_DEFAULTS = {
+    'media_type': 'unknown',
+    'content_theme': 'general',
+    'creative_type': 'video'
+}
+
+
+def _build_ad_name_pattern(rules: Dict[str, List[Tuple[str, List[str]]]]) -> re.Pattern:
+    """
+    광고명 특성 추출용 단일 정규식 생성
+
+    특성마다 선택적 lookahead 하나를 두고, 그 안에서 값별 분기를 우선순위
+    순서로 시도합니다. 문자열 내 위치가 아니라 규칙 순서대로 매칭되므로
+    기존 if/elif 체인과 같은 결과를 한 번의 match로 얻습니다.
+    그룹 이름은 '{특성}_{값 인덱스}' 형식이며, 입력은 소문자로 변환된
+    문자열을 전제로 합니다.
+    """
+    lookaheads = []
+    for feature, values in rules.items():
+        branches = '|'.join(
+            rf".*?(?P<{feature}_{i}>{'|'.join(map(re.escape, keywords))})"
+            for i, (_, keywords) in enumerate(values)
+        )
+        lookaheads.append(f'(?:(?={branches}))?')
+
+    return re.compile('^' + ''.join(lookaheads), re.DOTALL)
+
+
+AD_NAME_PATTERN = _build_ad_name_pattern(AD_NAME_RULES)
+
 
 class AppsflyerDataProcessorAdapted:
     """실제 Data_dua.csv 형식에 맞춘 Appsflyer Raw Data 처리 클래스"""
@@ -76,8 +128,20 @@ class AppsflyerDataProcessorAdapted:
                 if df[col].dtype == 'object':
                     df[col] = df[col].astype(str).str.replace('$', '').str.replace(',', '')
 
-                # 숫자로 변환
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+                # 숫자로 변환 후 NaN을 같은 버퍼에서 0으로 치환 (fillna의 추가 할당 방지)
+                values = np.asarray(pd.to_numeric(df[col].to_numpy(), errors='coerce'),
+                                    dtype=np.float64)
+                if not values.flags.writeable:
+                    values = values.copy()  # Copy-on-Write 읽기 전용 뷰 대응
+                np.nan_to_num(values, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
+                df[col] = values
+
+        # 카운트 컬럼은 최소 크기의 부호 없는 정수로 축소
+        # (이후 KPI/순위 계산에서 캐시를 지나는 바이트 수 절감)
+        # 비용은 합계/단가의 센트 단위 정확도를 위해 float64 유지
+        for col in ['impressions', 'clicks', 'installs', 'signups', 'd1_retained_users']:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], downcast='unsigned')
 
         logger.info("데이터 정제 완료")
         return df
@@ -86,65 +150,26 @@ class AppsflyerDataProcessorAdapted:
         """광고명에서 캠페인 정보 추출"""
         processed_df = df.copy()
 
-        # 광고명 분석을 통한 정보 추출
-        def extract_info(ad_name):
-            if pd.isna(ad_name) or ad_name == '':
-                return {
-                    'media_type': 'unknown',
-                    'content_theme': 'unknown',
-                    'creative_type': 'unknown',
-                    'platform': 'unknown'
-                }
-
-            ad_name_lower = str(ad_name).lower()
-
-            # 매체 추출 (광고명에서 추론)
-            media_type = 'unknown'
-            if 'ttcx' in ad_name_lower or 'tiktok' in ad_name_lower:
-                media_type = 'tiktok'
-            elif 'meta' in ad_name_lower or 'facebook' in ad_name_lower or 'instagram' in ad_name_lower:
-                media_type = 'meta'
-            elif 'echo' in ad_name_lower:
-                media_type = 'echo'  # Echo 매체로 추정
-            elif 'spoon' in ad_name_lower:
-                media_type = 'spoon'  # Spoon 매체로 추정
-            elif 'innoceans' in ad_name_lower:
-                media_type = 'innoceans'  # Innoceans 매체로 추정
-
-            # 콘텐츠 테마 추출
-            content_theme = 'general'
-            if 'participation' in ad_name_lower:
-                content_theme = 'participation'
-            elif 'blinddate' in ad_name_lower:
-                content_theme = 'blinddate'
-            elif 'interest' in ad_name_lower:
-                content_theme = 'interest'
-            elif 'tpo' in ad_name_lower:
-                content_theme = 'tpo'
-
-            # 크리에이티브 타입 추출
-            creative_type = 'video'
-            if 'vdo' in ad_name_lower or 'video' in ad_name_lower:
-                creative_type = 'video'
-            elif 'img' in ad_name_lower or 'image' in ad_name_lower:
-                creative_type = 'image'
-
-            # 플랫폼 추출 (광고명에서 추론이 어려워 기본값 설정)
-            platform = 'mixed'  # AOS/iOS 구분이 어려움
-
-            return {
-                'media_type': media_type,
-                'content_theme': content_theme,
-                'creative_type': creative_type,
-                'platform': platform
-            }
+        # 소문자 변환은 한 번만 수행하고 모든 특성 추출에 재사용
+        ad_names_lower = processed_df['ad_name'].astype('string').str.lower()
+        missing = (ad_names_lower.fillna('') == '').to_numpy()
 
-        # 각 광고명에 대해 정보 추출
-        extracted_info = processed_df['ad_name'].apply(extract_info)
+        # 모든 특성을 한 번의 정규식 매칭으로 추출
+        extracted = ad_names_lower.str.extract(AD_NAME_PATTERN)
+        del ad_names_lower
 
-        # 추출된 정보를 별도 컬럼으로 분리
-        for key in ['media_type', 'content_theme', 'creative_type', 'platform']:
-            processed_df[key] = [info[key] for info in extracted_info]
+        for feature, values in AD_NAME_RULES.items():
+            conditions = [
+                extracted[f'{feature}_{i}'].notna().to_numpy()
+                for i in range(len(values))
+            ]
+            choices = [value for value, _ in values]
+            feature_values = np.select(conditions, choices, default=AD_NAME_DEFAULTS[feature])
+            # 값 종류가 적으므로 Categorical로 저장 (정수 코드 + 카테고리 사전)
+            processed_df[feature] = pd.Categorical(np.where(missing, 'unknown', feature_values))
+
+        # 플랫폼 (광고명에서 AOS/iOS 구분이 어려워 기본값 설정)
+        processed_df['platform'] = pd.Categorical(np.where(missing, 'unknown', 'mixed'))
 
         # 콘텐츠명 생성 (원본 ad_name 사용)
         processed_df['content_name'] = processed_df['ad_name']
@@ -282,27 +307,56 @@ class AppsflyerDataProcessorAdapted:
         if self.processed_data is None:
             return {}
 
+        data = self.processed_data
+
         # 유효한 D1 Retained CAC 값들만 계산
-        valid_d1_cac = self.processed_data[
-            (self.processed_data['d1_retained_cac'] != np.inf) &
-            (self.processed_data['d1_retained_cac'] > 0)
+        valid_d1_cac = data[
+            (data['d1_retained_cac'] != np.inf) &
+            (data['d1_retained_cac'] > 0)
         ]['d1_retained_cac']
 
+        # 합계/평균을 한 번의 agg 호출로 계산
+        totals = data.agg({
+            'cost': 'sum',
+            'installs': 'sum',
+            'd1_retained_users': 'sum',
+            'cpi': 'mean',
+            'ctr': 'mean'
+        })
+
+        # 상위 10개: 전체 정렬 대신 np.partition(O(N))으로 경계값을 구한 뒤 10개만 정렬
+        # overall_rank는 동점(평균 순위)이 흔하므로 nsmallest(keep='first')와 같게
+        # 경계값 동점은 앞쪽 행부터 채우고, 위치 순서로 정렬한 뒤 안정 정렬
+        ranks = data['overall_rank'].to_numpy()
+        top_n = min(10, len(ranks))
+        if top_n < len(ranks):
+            cutoff = np.partition(ranks, top_n - 1)[top_n - 1]
+            below = np.flatnonzero(ranks < cutoff)
+            tied = np.flatnonzero(ranks == cutoff)[:top_n - len(below)]
+            top_idx = np.sort(np.concatenate([below, tied]))
+        else:
+            top_idx = np.arange(len(ranks))
+        top = data.iloc[top_idx].sort_values('overall_rank', kind='stable')
+        top_columns = ['content_name', 'media_type', 'content_theme', 'performance_grade',
+                       'd1_retained_cac', 'cpi', 'ctr', 'cost', 'installs', 'd1_retained_users']
+
         stats = {
-            'total_contents': len(self.processed_data),
-            'total_cost': self.processed_data['cost'].sum(),
-            'total_installs': self.processed_data['installs'].sum(),
-            'total_d1_retained_users': self.processed_data['d1_retained_users'].sum(),
+            'total_contents': len(data),
+            'total_cost': totals['cost'],
+            'total_installs': int(totals['installs']),
+            'total_d1_retained_users': int(totals['d1_retained_users']),
             'avg_d1_retained_cac': valid_d1_cac.mean() if len(valid_d1_cac) > 0 else 0,
-            'avg_cpi': self.processed_data['cpi'].mean(),
-            'avg_ctr': self.processed_data['ctr'].mean(),
-            'media_distribution': self.processed_data['media_type'].value_counts().to_dict(),
-            'content_theme_distribution': self.processed_data['content_theme'].value_counts().to_dict(),
-            'performance_grade_distribution': self.processed_data['performance_grade'].value_counts().to_dict(),
-            'top_performers': self.processed_data.nsmallest(10, 'overall_rank')[
-                ['content_name', 'media_type', 'content_theme', 'performance_grade',
-                 'd1_retained_cac', 'cpi', 'ctr', 'cost', 'installs', 'd1_retained_users']
-            ].to_dict('records')
+            'avg_cpi': totals['cpi'],
+            'avg_ctr': totals['ctr'],
+            'media_distribution': data['media_type'].value_counts().to_dict(),
+            'content_theme_distribution': data['content_theme'].value_counts().to_dict(),
+            'performance_grade_distribution': data['performance_grade'].value_counts().to_dict(),
+            # 행별 dict 대신 컬럼별 배열: 숫자 컬럼은 NumPy 배열 그대로
+            # (orjson이 직접 직렬화), 문자열 컬럼은 str 리스트
+            'top_performers': {
+                col: top[col].to_numpy() if top[col].dtype.kind in 'iuf' else top[col].tolist()
+                for col in top_columns
+            }
         }
 
         return stats
@@ -314,4 +368,18 @@ class AppsflyerDataProcessorAdapted:
 
         self.processed_data.to_csv(output_path, index=False, encoding='utf-8-sig')
         logger.info(f"처리된 데이터 CSV 저장 완료: {output_path}")
+        return output_path
+
+    def export_to_parquet(self, output_path: str) -> str:
+        """
+        처리된 데이터를 Parquet으로 내보내기 (pyarrow 필요)
+
+        컬럼 단위로 기록하고 zstd로 압축하므로 CSV보다 쓰기가 빠르고
+        파일도 작습니다. 엑셀에서 열어볼 파일은 export_to_csv를 사용하세요.
+        """
+        if self.processed_data is None:
+            raise ValueError("처리된 데이터가 없습니다. process() 메서드를 먼저 실행하세요.")
+
+        self.processed_data.to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
+        logger.info(f"처리된 데이터 Parquet 저장 완료: {output_path}")
         return output_path
\ No newline at end of file
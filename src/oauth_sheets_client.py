@@ -11,6 +11,8 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 import google.auth
 
+from sheets_client import encode_json
+
 # Google Sheets API 스코프
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 
@@ -72,7 +74,7 @@ class OAuthGoogleSheetsClient:
             if method.upper() == 'GET':
                 response = self.session.get(self.web_app_url, params=params, headers=headers)
             else:  # POST
-                response = self.session.post(self.web_app_url, json=data, headers=headers)
+                response = self.session.post(self.web_app_url, data=encode_json(data), headers=headers)
 
             response.raise_for_status()
             return response.json()
@@ -170,8 +172,9 @@ class ServiceAccountSheetsClient:
 
     def _make_authenticated_request(self, method: str, params: Dict = None, data: Dict = None) -> Dict[str, Any]:
         """서비스 계정으로 인증된 요청"""
-        # 서비스 계정 토큰 가져오기
-        self.creds.refresh(Request())
+        # 토큰이 없거나 만료 임박(60초 여유)인 경우에만 갱신
+        if not self.creds.valid:
+            self.creds.refresh(Request())
 
         headers = {
             'Authorization': f'Bearer {self.creds.token}',
@@ -182,7 +185,7 @@ class ServiceAccountSheetsClient:
             if method.upper() == 'GET':
                 response = self.session.get(self.web_app_url, params=params, headers=headers)
             else:  # POST
-                response = self.session.post(self.web_app_url, json=data, headers=headers)
+                response = self.session.post(self.web_app_url, data=encode_json(data), headers=headers)
 
             response.raise_for_status()
             return response.json()
@@ -1,12 +1,316 @@
 import requests
+import re
+import gzip
 import json
+import base64
 import time
-from typing import List, Dict, Any, Optional
-from functools import wraps
+import random
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache, wraps
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx HTTP/2 지원에 필요)
+    HTTP2_AVAILABLE = True
+except ImportError:  # httpx[http2] 미설치 시 requests 전송 사용
+    HTTP2_AVAILABLE = False
+    try:
+        import httpx
+    except ImportError:
+        httpx = None
+
+logger = logging.getLogger(__name__)
+
+# Google Sheets URL의 스프레드시트 ID 부분
+_SHEET_ID_RE = re.compile(r'/d/([a-zA-Z0-9_-]+)')
+
+# 이 크기(바이트)를 넘는 POST 본문은 gzip으로 압축해서 전송
+GZIP_MIN_BYTES = 4096
+
+# overwrite_sheet를 나눠 보낼 행 수 (Apps Script 요청 크기/6분 실행 제한 대응)
+OVERWRITE_CHUNK_ROWS = 10000
+
+# 전송 계층에서 재시도할 HTTP 상태 코드 (requests/httpx 공통)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# 전송 계층 예외 (requests + 설치된 경우 httpx)
+REQUEST_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
+
+def encode_json(payload: Any) -> bytes:
+    """
+    요청 페이로드를 JSON 바이트로 직렬화
+
+    orjson이 설치되어 있으면 사용하고 (numpy 배열/스칼라 직접 지원),
+    없으면 표준 json 모듈로 대체합니다.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def compress_body(body: bytes, level: int = 6) -> bytes:
+    """
+    POST 본문을 gzip 압축 후 base64로 인코딩
+
+    Apps Script의 e.postData.contents는 문자열로만 전달되므로 바이너리 gzip을
+    그대로 보내면 깨집니다. base64로 감싸서 보내고 서버에서
+    Utilities.base64Decode + Utilities.ungzip으로 복원합니다.
+    표 형태의 JSON은 base64 오버헤드를 포함해도 수 배 작아집니다.
+    """
+    return base64.b64encode(gzip.compress(body, compresslevel=level))
+
+
+def decode_json(content: bytes) -> Any:
+    """
+    응답 본문(bytes)을 JSON으로 파싱
+
+    중간 str 디코딩 없이 바이트에서 바로 파싱합니다. orjson의 JSONDecodeError는
+    json.JSONDecodeError의 하위 클래스이므로 기존 예외 처리와 호환됩니다.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _post_body(session, url: str, body: bytes, headers: Dict[str, str],
+               params: Optional[Dict[str, str]] = None) -> Any:
+    """직렬화된 본문 POST 후 응답 파싱 (requests/httpx 인자명 차이 처리)"""
+    if httpx is not None and isinstance(session, httpx.Client):
+        response = session.post(url, content=body, headers=headers, params=params)
+    else:
+        response = session.post(url, data=body, headers=headers, params=params)
+    response.raise_for_status()
+    return decode_json(response.content)
+
+
+def post_json(session, url: str, payload: Dict[str, Any],
+              compress_min_bytes: Optional[int] = GZIP_MIN_BYTES,
+              level: int = 6) -> Tuple[Dict[str, Any], Optional[int]]:
+    """
+    JSON 페이로드 POST (큰 본문은 gzip+base64로 압축 전송)
+
+    Apps Script 웹 앱은 요청 헤더를 읽을 수 없으므로 압축 여부는
+    contentEncoding=gzip 쿼리 파라미터로 알립니다.
+    전송/파싱 예외는 호출자가 처리합니다.
+
+    Args:
+        session: requests.Session 또는 httpx.Client
+        url: Apps Script 웹 앱 URL
+        payload: 요청 데이터
+        compress_min_bytes: 이 크기를 넘는 본문은 압축 (None이면 압축 안 함)
+        level: gzip 압축 레벨
+
+    Returns:
+        (응답 데이터, 이후 요청에 사용할 compress_min_bytes)
+        압축 본문을 해석하지 못하는 구버전 Apps Script이면 압축을 끄고(None) 원본으로 다시 전송합니다.
+    """
+    body = encode_json(payload)
+
+    if compress_min_bytes is not None and len(body) > compress_min_bytes:
+        result = _post_body(session, url, compress_body(body, level),
+                            headers={'Content-Type': 'text/plain'},
+                            params={'contentEncoding': 'gzip'})
+
+        # 요청 파싱 단계에서 실패했으므로 쓰기 없이 끝난 요청임
+        if 'SyntaxError' not in str(result.get('error', '')):
+            return result, compress_min_bytes
+        compress_min_bytes = None
 
+    result = _post_body(session, url, body, headers={'Content-Type': 'application/json'})
+    return result, compress_min_bytes
+
+
+def create_session(pool_size: int = 16, retries: int = 5,
+                   backoff_factor: float = 0.5) -> requests.Session:
+    """
+    연결 풀과 전송 계층 재시도가 설정된 requests 세션 생성
+
+    429/5xx 응답과 연결 오류는 urllib3가 연결 계층에서 재시도하며
+    Retry-After 헤더를 따릅니다. 재시도를 모두 소진하면 마지막 응답이
+    그대로 반환되어 raise_for_status()에서 오류로 처리됩니다.
+
+    Args:
+        pool_size: 호스트별 유지할 최대 연결 수 (동시 요청 수에 맞춤)
+        retries: 최대 재시도 횟수
+        backoff_factor: 지수 백오프 계수 (초)
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=['GET', 'POST'],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+if httpx is not None:
+    class StatusRetryTransport(httpx.BaseTransport):
+        """
+        429/5xx 응답을 재시도하는 httpx 전송 래퍼
 
-def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
-    """실패 시 재시도 데코레이터 (rate limiting 특별 처리 포함)"""
+        httpx 전송 계층은 연결 오류만 재시도하므로, requests 세션의 urllib3 Retry와
+        같은 정책(지수 백오프, Retry-After 준수)으로 상태 코드 재시도를 추가합니다.
+        재시도를 모두 소진하면 마지막 응답을 그대로 반환합니다.
+        """
+
+        def __init__(self, transport: 'httpx.BaseTransport', retries: int = 5,
+                     backoff_factor: float = 0.5):
+            self._transport = transport
+            self.retries = retries
+            self.backoff_factor = backoff_factor
+
+        def handle_request(self, request: 'httpx.Request') -> 'httpx.Response':
+            for attempt in range(self.retries + 1):
+                response = self._transport.handle_request(request)
+                if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                    return response
+
+                # urllib3 Retry와 같은 백오프: 첫 재시도는 즉시, 이후 backoff_factor * 2^n
+                delay = parse_retry_after(response.headers.get('Retry-After'))
+                if delay is None:
+                    delay = 0.0 if attempt == 0 else min(self.backoff_factor * (2 ** attempt),
+                                                         Retry.DEFAULT_BACKOFF_MAX)
+                response.close()
+                logger.warning("HTTP %d 응답, %.1f초 후 재시도 (%d/%d)",
+                               response.status_code, delay, attempt + 1, self.retries)
+                time.sleep(delay)
+
+        def close(self) -> None:
+            self._transport.close()
+
+
+def create_http2_client(pool_size: int = 32, retries: int = 5,
+                        backoff_factor: float = 0.5) -> 'httpx.Client':
+    """
+    HTTP/2 멀티플렉싱을 사용하는 httpx 클라이언트 생성
+
+    동시 요청을 하나의 TLS 연결 위에서 다중화하고, 유휴 연결을 keep-alive로
+    유지해 반복 TLS 핸드셰이크를 없앱니다. 재시도 정책은 create_session()과 같습니다
+    (연결 오류 + 429/5xx, Retry-After 준수). ``pip install httpx[http2]``가 필요합니다.
+
+    Args:
+        pool_size: 최대 연결 수 및 유지할 keep-alive 연결 수
+        retries: 최대 재시도 횟수
+        backoff_factor: 지수 백오프 계수 (초)
+    """
+    if not HTTP2_AVAILABLE:
+        raise ImportError("HTTP/2 전송을 사용하려면 httpx[http2] 패키지가 필요합니다.")
+
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+    transport = StatusRetryTransport(
+        httpx.HTTPTransport(http2=True, retries=retries, limits=limits),
+        retries=retries,
+        backoff_factor=backoff_factor
+    )
+    # Apps Script 실행은 최대 6분까지 걸릴 수 있으므로 응답 대기 시간은 길게 설정
+    timeout = httpx.Timeout(30.0, read=360.0)
+    # Apps Script 웹 앱은 결과를 리다이렉트로 돌려주므로 follow_redirects 필요
+    return httpx.Client(transport=transport, timeout=timeout, follow_redirects=True)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 값(초 또는 HTTP 날짜)을 대기 시간(초)으로 변환"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def request_error(e: Exception, transport_retried: bool = False) -> Dict[str, Any]:
+    """
+    전송 예외를 오류 딕셔너리로 변환
+
+    HTTP 응답이 있는 경우 상태 코드와 Retry-After 값을 함께 담아
+    재시도 데코레이터가 판단에 사용할 수 있도록 합니다.
+
+    Args:
+        e: 전송 예외
+        transport_retried: 전송 계층(urllib3 Retry)에서 이미 재시도를 소진한 오류인지 여부
+    """
+    result = {'error': f'Request failed: {str(e)}'}
+    if transport_retried:
+        result['transport_retried'] = True
+    response = getattr(e, 'response', None)
+    if response is not None:
+        result['status'] = response.status_code
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if retry_after is not None:
+            result['retry_after'] = retry_after
+    return result
+
+
+def is_transient_error(result: Dict[str, Any]) -> bool:
+    """
+    재시도할 가치가 있는 일시적 오류인지 판단
+
+    429, 5xx, 네트워크 오류(상태 코드 없음)만 재시도하고
+    나머지 4xx(잘못된 요청, 시트 없음 등)는 즉시 반환합니다.
+    Apps Script는 HTTP 200에 statusCode 필드로 오류를 알리므로 이 값도 확인합니다.
+    """
+    # 분할 전송 중 실패: 각 청크 요청에서 이미 재시도했으므로 전체를 다시 보내지 않음
+    if 'rows_written' in result:
+        return False
+
+    # 일부 작업이 이미 적용된 batch 실패: 다시 보내면 앞선 작업(append 등)이 중복 실행됨
+    if 'results' in result:
+        return False
+
+    # 연결 오류/429/5xx를 전송 계층에서 이미 재시도한 경우 다시 반복하지 않음
+    # (데코레이터는 Apps Script 본문의 statusCode 오류만 담당)
+    if result.get('transport_retried'):
+        return False
+
+    error_msg = str(result.get('error', '')).lower()
+    if '429' in error_msg or 'rate limit' in error_msg or 'too many' in error_msg:
+        return True
+
+    status = result.get('status') or result.get('statusCode')
+    if status is None:
+        return True
+    return status == 429 or status >= 500
+
+
+def retry_on_failure(max_retries: int = 5, base: float = 0.5,
+                     cap: float = 90.0, jitter: float = 0.3):
+    """
+    실패 시 재시도 데코레이터 (지수 백오프 + 지터, Retry-After 준수)
+
+    대기 시간은 min(cap, base * 2**attempt) + random()*jitter 이며,
+    서버가 Retry-After를 보낸 경우 그 값(최대 cap)을 우선합니다.
+    cap 기본값 90초는 Google의 분당 할당량 창을 넘기기 위한 값입니다.
+
+    Args:
+        max_retries: 최대 시도 횟수
+        base: 첫 재시도 대기 시간 (초)
+        cap: 최대 대기 시간 (초)
+        jitter: 동시 재시도가 몰리지 않도록 더하는 무작위 대기 시간 상한 (초)
+    """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -18,24 +322,23 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
 
                 error_msg = result.get('error', '')
 
-                # Rate limiting (429) 에러인 경우 더 오래 기다림
-                if '429' in str(error_msg) or 'rate' in str(error_msg).lower():
-                    if attempt < max_retries - 1:
-                        wait_time = delay * (3 ** attempt) + 2  # 더 긴 대기 시간
-                        print(f"Rate limit 감지, 재시도 {attempt + 1}/{max_retries} ({wait_time}초 대기): {error_msg}")
-                        time.sleep(wait_time)
-                    else:
-                        print(f"Rate limit으로 최종 실패: {error_msg}")
-                        return result
+                if not is_transient_error(result):
+                    logger.error("재시도하지 않는 오류: %s", error_msg)
+                    return result
+
+                if attempt == max_retries - 1:
+                    logger.error("최종 실패: %s", error_msg)
+                    return result
+
+                retry_after = result.get('retry_after')
+                if retry_after is not None:
+                    wait_time = min(cap, retry_after)
                 else:
-                    # 일반적인 오류 처리
-                    if attempt < max_retries - 1:
-                        wait_time = delay * (2 ** attempt)
-                        print(f"재시도 {attempt + 1}/{max_retries} ({wait_time}초 대기): {error_msg}")
-                        time.sleep(wait_time)
-                    else:
-                        print(f"최종 실패: {error_msg}")
-                        return result
+                    wait_time = min(cap, base * (2 ** attempt))
+                wait_time += random.random() * jitter
+
+                logger.warning("재시도 %d/%d (%.1f초 대기): %s", attempt + 1, max_retries, wait_time, error_msg)
+                time.sleep(wait_time)
 
             return result
         return wrapper
@@ -45,21 +348,42 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
 class GoogleSheetsClient:
     """Google Apps Script 웹 앱을 통한 Google Sheets 클라이언트"""
 
-    def __init__(self, web_app_url: str):
+    def __init__(self, web_app_url: str, http2: bool = False,
+                 compress_min_bytes: Optional[int] = GZIP_MIN_BYTES,
+                 warm_up: bool = True):
         """
         Args:
             web_app_url: Apps Script 웹 앱 URL
+            http2: True이면 httpx HTTP/2 클라이언트 사용 (httpx[http2] 필요).
+                기본값은 requests 세션
+            compress_min_bytes: 이 크기를 넘는 POST 본문은 gzip 압축해서 전송.
+                None이면 압축하지 않음
+            warm_up: True이면 백그라운드에서 미리 연결을 열어 첫 요청의 TLS 핸드셰이크 지연을 숨김
         """
         self.web_app_url = web_app_url
-        self.session = requests.Session()
+        self.http2 = http2
+        self.compress_min_bytes = compress_min_bytes
+        self.session = create_http2_client() if http2 else create_session()
+
+        if warm_up:
+            threading.Thread(target=self._warm_up_connection, daemon=True).start()
+
+    def _warm_up_connection(self):
+        """HEAD 요청으로 TCP/TLS 연결을 열어 세션 연결 풀에 보관 (실패해도 무시)"""
+        try:
+            self.session.head(self.web_app_url, timeout=5)
+        except Exception:
+            pass
 
-    def read_sheet(self, sheet_id: str, sheet_name: str = 'Sheet1') -> Dict[str, Any]:
+    def read_sheet(self, sheet_id: str, sheet_name: str = 'Sheet1',
+                   meta_only: bool = False) -> Dict[str, Any]:
         """
         스프레드시트 데이터 읽기
 
         Args:
             sheet_id: 스프레드시트 ID
             sheet_name: 시트 이름 (기본값: 'Sheet1')
+            meta_only: True이면 셀 값 없이 rows/columns/writable만 조회
 
         Returns:
             응답 데이터 딕셔너리
@@ -68,16 +392,37 @@ class GoogleSheetsClient:
             'sheetId': sheet_id,
             'sheetName': sheet_name
         }
+        if meta_only:
+            params['metaOnly'] = 'true'
 
         try:
             response = self.session.get(self.web_app_url, params=params)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {'error': f'Request failed: {str(e)}'}
+            return decode_json(response.content)
+        except REQUEST_ERRORS as e:
+            return request_error(e, self._transport_retried(e))
         except json.JSONDecodeError as e:
             return {'error': f'Invalid JSON response: {str(e)}'}
 
+    def read_sheets(self, items: List[Tuple[str, str]],
+                    max_workers: int = 8, meta_only: bool = False) -> List[Dict[str, Any]]:
+        """
+        여러 시트를 병렬로 읽기
+
+        Args:
+            items: (스프레드시트 ID, 시트 이름) 튜플 목록
+            max_workers: 동시 요청 수
+            meta_only: True이면 셀 값 없이 rows/columns/writable만 조회
+
+        Returns:
+            items와 같은 순서의 응답 데이터 목록
+        """
+        if not items:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(lambda item: self.read_sheet(*item, meta_only=meta_only), items))
+
     def update_range(self, sheet_id: str, range_str: str, data: List[List],
                     sheet_name: str = 'Sheet1') -> Dict[str, Any]:
         """
@@ -118,6 +463,27 @@ class GoogleSheetsClient:
 
         return self._post_request(payload)
 
+    def append_many(self, items: List[Tuple[str, List[List], str]],
+                    max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        여러 시트에 병렬로 행 추가
+
+        Note: 같은 시트에 대한 동시 추가는 행 순서가 보장되지 않으므로
+        서로 다른 시트에 쓸 때 사용하세요.
+
+        Args:
+            items: (스프레드시트 ID, 추가할 데이터, 시트 이름) 튜플 목록
+            max_workers: 동시 요청 수
+
+        Returns:
+            items와 같은 순서의 응답 데이터 목록
+        """
+        if not items:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(lambda item: self.append_rows(*item), items))
+
     def overwrite_sheet(self, sheet_id: str, data: List[List],
                        sheet_name: str = 'Sheet1') -> Dict[str, Any]:
         """
@@ -128,6 +494,9 @@ class GoogleSheetsClient:
             data: 새로운 데이터 (2차원 리스트)
             sheet_name: 시트 이름
         """
+        if len(data) > OVERWRITE_CHUNK_ROWS:
+            return self.overwrite_sheet_chunked(sheet_id, data, sheet_name)
+
         payload = {
             'sheetId': sheet_id,
             'sheetName': sheet_name,
@@ -137,6 +506,44 @@ class GoogleSheetsClient:
 
         return self._post_request(payload)
 
+    def overwrite_sheet_chunked(self, sheet_id: str, data: List[List],
+                                sheet_name: str = 'Sheet1',
+                                chunk_size: int = OVERWRITE_CHUNK_ROWS) -> Dict[str, Any]:
+        """
+        큰 데이터를 행 단위로 나눠서 시트 덮어쓰기
+
+        첫 청크는 overwrite로 시트를 비우면서 쓰고, 나머지는 append로 이어 붙입니다.
+        같은 시트에 대한 동시 쓰기는 Apps Script에서 안전하지 않으므로 순차 전송하며,
+        청크별로 요청하므로 재시도 시에도 실패한 청크만 다시 보냅니다.
+
+        Args:
+            sheet_id: 스프레드시트 ID
+            data: 새로운 데이터 (2차원 리스트)
+            sheet_name: 시트 이름
+            chunk_size: 요청당 행 수
+
+        Returns:
+            응답 데이터 딕셔너리 (실패 시 rows_written에 성공한 행 수 포함)
+        """
+        result = self.overwrite_sheet(sheet_id, data[:chunk_size], sheet_name)
+        if 'error' in result:
+            return {**result, 'rows_written': 0}
+
+        rows_written = min(chunk_size, len(data))
+        for start in range(chunk_size, len(data), chunk_size):
+            chunk = data[start:start + chunk_size]
+            result = self.append_rows(sheet_id, chunk, sheet_name)
+            if 'error' in result:
+                return {**result, 'rows_written': rows_written}
+            rows_written += len(chunk)
+
+        return {
+            'success': True,
+            'action': 'overwritten',
+            'rows': rows_written,
+            'chunks': -(-len(data) // chunk_size)
+        }
+
     def clear_sheet(self, sheet_id: str, range_str: Optional[str] = None,
                    sheet_name: str = 'Sheet1') -> Dict[str, Any]:
         """
@@ -194,18 +601,51 @@ class GoogleSheetsClient:
 
         return self._post_request(payload)
 
+    def batch(self, sheet_id: str, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        여러 쓰기 작업을 한 번의 요청으로 실행
+
+        Apps Script에서 작업들을 순서대로 실행하므로 N번의 왕복이 1번으로 줄어듭니다.
+        작업 목록은 BatchBuilder로 만들 수 있습니다.
+
+        Args:
+            sheet_id: 스프레드시트 ID
+            ops: 작업 목록. 각 작업은 'action'(update/append/clear/overwrite)과
+                'sheetName', 작업에 따라 'range'/'data'를 포함
+
+        Returns:
+            작업별 결과('results')를 포함한 응답 데이터
+        """
+        payload = {
+            'sheetId': sheet_id,
+            'action': 'batch',
+            'ops': ops
+        }
+
+        return self._post_request(payload)
+
+    def _transport_retried(self, e: Exception) -> bool:
+        """
+        전송 계층에서 이미 재시도된 오류인지 판단
+
+        requests 세션(urllib3 Retry)과 httpx 전송(StatusRetryTransport)은
+        모두 연결 실패와 429/5xx 응답을 재시도합니다.
+        """
+        if not self.http2:
+            return True
+        if isinstance(e, httpx.HTTPStatusError):
+            return e.response.status_code in RETRY_STATUSES
+        return isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+
     def _post_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """POST 요청 헬퍼 메서드"""
         try:
-            response = self.session.post(
-                self.web_app_url,
-                data=json.dumps(payload),
-                headers={'Content-Type': 'application/json'}
+            result, self.compress_min_bytes = post_json(
+                self.session, self.web_app_url, payload, self.compress_min_bytes
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            return {'error': f'Request failed: {str(e)}'}
+            return result
+        except REQUEST_ERRORS as e:
+            return request_error(e, self._transport_retried(e))
         except json.JSONDecodeError as e:
             return {'error': f'Invalid JSON response: {str(e)}'}
 
@@ -213,39 +653,90 @@ class GoogleSheetsClient:
 class RobustGoogleSheetsClient(GoogleSheetsClient):
     """재시도 기능이 포함된 안정적인 Google Sheets 클라이언트"""
 
-    @retry_on_failure(max_retries=3, delay=1.0)
-    def read_sheet(self, sheet_id: str, sheet_name: str = 'Sheet1'):
-        return super().read_sheet(sheet_id, sheet_name)
+    # 재시도를 적용할 단일 요청 메서드 (read_sheets, append_many,
+    # overwrite_sheet_chunked 등은 내부에서 이 메서드들을 호출하므로 자동으로 재시도됨)
+    RETRIED_METHODS = (
+        'read_sheet', 'update_range', 'append_rows', 'overwrite_sheet',
+        'clear_sheet', 'create_sheet', 'get_sheet_names', 'batch'
+    )
 
-    @retry_on_failure(max_retries=3, delay=1.0)
-    def update_range(self, sheet_id: str, range_str: str, data: List[List],
-                    sheet_name: str = 'Sheet1'):
-        return super().update_range(sheet_id, range_str, data, sheet_name)
 
-    @retry_on_failure(max_retries=3, delay=1.0)
-    def append_rows(self, sheet_id: str, data: List[List],
-                   sheet_name: str = 'Sheet1'):
-        return super().append_rows(sheet_id, data, sheet_name)
+for _name in RobustGoogleSheetsClient.RETRIED_METHODS:
+    setattr(RobustGoogleSheetsClient, _name,
+            retry_on_failure()(getattr(GoogleSheetsClient, _name)))
+del _name
 
-    @retry_on_failure(max_retries=3, delay=1.0)
-    def overwrite_sheet(self, sheet_id: str, data: List[List],
-                       sheet_name: str = 'Sheet1'):
-        return super().overwrite_sheet(sheet_id, data, sheet_name)
 
-    @retry_on_failure(max_retries=3, delay=1.0)
-    def clear_sheet(self, sheet_id: str, range_str: Optional[str] = None,
-                   sheet_name: str = 'Sheet1'):
-        return super().clear_sheet(sheet_id, range_str, sheet_name)
+class BatchBuilder:
+    """
+    쓰기 작업을 모았다가 batch 요청 한 번으로 전송하는 컨텍스트 매니저
+
+    블록이 예외 없이 끝나면 모인 작업을 전송하고 결과를 result에 저장합니다.
+
+    Example:
+        with BatchBuilder(client, sheet_id) as batch:
+            batch.update_range('A1:B1', [['항목', '값']], '요약')
+            batch.append_rows([['총 비용', '100']], '요약')
+        print(batch.result)
+    """
+
+    def __init__(self, client: GoogleSheetsClient, sheet_id: str):
+        """
+        Args:
+            client: 요청을 보낼 GoogleSheetsClient
+            sheet_id: 스프레드시트 ID
+        """
+        self.client = client
+        self.sheet_id = sheet_id
+        self.ops: List[Dict[str, Any]] = []
+        self.result: Optional[Dict[str, Any]] = None
+
+    def update_range(self, range_str: str, data: List[List],
+                     sheet_name: str = 'Sheet1') -> 'BatchBuilder':
+        """범위 업데이트 작업 추가"""
+        self.ops.append({'action': 'update', 'sheetName': sheet_name,
+                         'range': range_str, 'data': data})
+        return self
+
+    def append_rows(self, data: List[List], sheet_name: str = 'Sheet1') -> 'BatchBuilder':
+        """행 추가 작업 추가"""
+        self.ops.append({'action': 'append', 'sheetName': sheet_name, 'data': data})
+        return self
+
+    def overwrite_sheet(self, data: List[List], sheet_name: str = 'Sheet1') -> 'BatchBuilder':
+        """시트 덮어쓰기 작업 추가"""
+        self.ops.append({'action': 'overwrite', 'sheetName': sheet_name, 'data': data})
+        return self
+
+    def clear_sheet(self, range_str: Optional[str] = None,
+                    sheet_name: str = 'Sheet1') -> 'BatchBuilder':
+        """시트 지우기 작업 추가"""
+        op = {'action': 'clear', 'sheetName': sheet_name}
+        if range_str:
+            op['range'] = range_str
+        self.ops.append(op)
+        return self
+
+    def flush(self) -> Dict[str, Any]:
+        """모인 작업을 한 번의 요청으로 전송"""
+        if not self.ops:
+            self.result = {'success': True, 'action': 'batch', 'count': 0, 'results': []}
+            return self.result
+
+        ops, self.ops = self.ops, []
+        self.result = self.client.batch(self.sheet_id, ops)
+        return self.result
 
-    @retry_on_failure(max_retries=3, delay=1.0)
-    def create_sheet(self, sheet_id: str, sheet_name: str):
-        return super().create_sheet(sheet_id, sheet_name)
+    def __enter__(self) -> 'BatchBuilder':
+        return self
 
-    @retry_on_failure(max_retries=3, delay=1.0)
-    def get_sheet_names(self, sheet_id: str):
-        return super().get_sheet_names(sheet_id)
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is None:
+            self.flush()
+        return False
 
 
+@lru_cache(maxsize=128)
 def extract_sheet_id_from_url(url: str) -> str:
     """
     Google Sheets URL에서 스프레드시트 ID 추출
@@ -256,6 +747,5 @@ def extract_sheet_id_from_url(url: str) -> str:
     Returns:
         스프레드시트 ID
     """
-    if '/d/' in url:
-        return url.split('/d/')[1].split('/')[0]
-    return url
\ No newline at end of file
+    match = _SHEET_ID_RE.search(url)
+    return match.group(1) if match else url
\ No newline at end of file
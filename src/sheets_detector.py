@@ -3,29 +3,137 @@ Google Sheets 시트명 자동 감지 및 매핑 모듈
 """
 
 import os
+import re
+import time
+import hashlib
 import logging
-from typing import Dict, List, Optional
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
 
 # 기존 sheets_client import
-from sheets_client import GoogleSheetsClient
+from sheets_client import GoogleSheetsClient, encode_json, decode_json
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
-# 환경변수 로드
-load_dotenv()
+# 감지 결과 캐시 위치 및 유효 시간 (초)
+CACHE_DIR = Path.home() / '.cache' / 'csvsheetsbridge'
+SHEETS_CACHE_TTL = 3600
+
+
+# 시트 용도별 키워드 (시트명 소문자에 포함되면 해당 용도로 매핑)
+SHEET_PURPOSE_KEYWORDS = {
+    'main_data': ['sheet1', '시트1', 'main', '메인', 'data', '데이터', '메인데이터'],
+    'summary': ['summary', '요약', '분석'],
+    'top_performers': ['top', '상위', '성과', 'performer', 'ranking', '랭킹'],
+    'pivot_table': ['pivot', '피벗', 'table', '테이블'],
+}
+
+KEYWORD_TO_PURPOSE = {
+    keyword: purpose
+    for purpose, keywords in SHEET_PURPOSE_KEYWORDS.items()
+    for keyword in keywords
+}
+
+# 모든 키워드를 한 번에 찾는 정규식
+# 전방탐색으로 위치마다 검사하므로 겹치는 키워드도 모두 찾음 (긴 키워드 우선)
+SHEET_KEYWORD_PATTERN = re.compile(
+    '(?=(' + '|'.join(map(re.escape, sorted(KEYWORD_TO_PURPOSE, key=len, reverse=True))) + '))'
+)
+
+
+def match_sheet_purposes(sheet_name: str) -> set:
+    """시트명에 포함된 키워드로 해당하는 용도 집합 반환"""
+    return {
+        KEYWORD_TO_PURPOSE[m.group(1)]
+        for m in SHEET_KEYWORD_PATTERN.finditer(sheet_name.lower())
+    }
+
+
+# 시트 감지 실패 시 사용하는 기본 설정
+DEFAULT_SHEET_CONFIG = {
+    'main_data_sheet': 'Sheet1',
+    'summary_sheet': 'Sheet1',
+    'top_performers_sheet': 'Sheet1',
+    'pivot_table_sheet': 'Sheet1'
+}
+
+
+# detect_sheets_auto 결과 캐시 ((web_app_url, sheet_id) -> 추천 설정)
+_SHEET_CONFIG_CACHE: Dict[tuple, Dict[str, str]] = {}
+
+# SheetsUpdater가 저장하는 감지 설정 캐시 파일 접두사
+SHEET_CONFIG_CACHE_PREFIX = 'sheet_config'
+
+
+def cache_key(prefix: str, sheet_id: str) -> str:
+    """시트 ID별 캐시 파일명 생성 (ID를 그대로 파일명에 쓰지 않도록 해시 사용)"""
+    digest = hashlib.sha256(sheet_id.encode('utf-8')).hexdigest()[:16]
+    return f"{prefix}_{digest}.json"
+
+
+def load_cache(name: str, ttl: float) -> Optional[Any]:
+    """
+    캐시 파일 로드
+
+    Args:
+        name: 캐시 파일명
+        ttl: 유효 시간 (초). 파일 수정 시각 기준으로 지났으면 None 반환
+
+    Returns:
+        캐시된 데이터 (없거나 만료/손상된 경우 None)
+    """
+    path = CACHE_DIR / name
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return decode_json(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def save_cache(name: str, data: Any) -> None:
+    """캐시 파일 저장 (실패해도 감지 결과에는 영향 없음)"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (CACHE_DIR / name).write_bytes(encode_json(data))
+    except OSError as e:
+        logger.debug(f"캐시 저장 실패: {name} - {str(e)}")
+
+
+def delete_cache(name: str) -> None:
+    """캐시 파일 삭제"""
+    try:
+        (CACHE_DIR / name).unlink()
+    except OSError:
+        pass
 
 
 class SheetsDetector:
     """Google Sheets 시트명 자동 감지 클래스"""
 
+    # 우선순위가 높은 시트명들 (가장 가능성이 높은 것부터)
+    PRIORITY_SHEETS = ('시트1', 'Sheet1', 'Sheet 1')
+
+    # 추가로 확인할 시트명들
+    ADDITIONAL_SHEETS = (
+        'Main', '메인', 'Data', '데이터',
+        'Summary', '요약', '분석',
+        '메인데이터', '상위성과', '피벗테이블'
+    )
+
     def __init__(self, web_app_url: str = None, sheet_id: str = None):
         """
         Args:
             web_app_url: Apps Script 웹 앱 URL
             sheet_id: Google Sheets ID
         """
+        # 인자로 받지 못한 값이 있을 때만 .env 로드
+        if not web_app_url or not sheet_id:
+            from dotenv import load_dotenv
+            load_dotenv()
+
         self.web_app_url = web_app_url or os.getenv('GOOGLE_SHEETS_WEB_APP_URL')
         self.sheet_id = sheet_id or os.getenv('GOOGLE_SHEETS_SHEET_ID')
 
@@ -35,80 +143,148 @@ class SheetsDetector:
         self.client = GoogleSheetsClient(self.web_app_url)
         self.available_sheets = []
         self.sheet_mapping = {}
+        self._cache_name = cache_key('sheets', self.sheet_id)
+        # 이번 실행에서 확인된 시트별 존재 여부 (중복 요청 방지)
+        self._probe_cache: Dict[str, bool] = {}
 
-    def get_available_sheets(self) -> List[str]:
+    def _load_cache(self) -> Optional[List[str]]:
+        """로컬 캐시에서 감지된 시트 목록 로드 (TTL 이내인 경우만)"""
+        return load_cache(self._cache_name, SHEETS_CACHE_TTL)
+
+    def _save_cache(self, sheets: List[str]) -> None:
+        """감지된 시트 목록을 로컬 캐시에 저장"""
+        save_cache(self._cache_name, sheets)
+
+    def invalidate_cache(self) -> None:
+        """감지 결과 캐시 삭제 (시트 구조가 바뀐 경우)"""
+        self.available_sheets = []
+        self.sheet_mapping = {}
+        delete_cache(self._cache_name)
+        # 시트 목록으로 만든 추천 설정 캐시도 함께 무효화
+        delete_cache(cache_key(SHEET_CONFIG_CACHE_PREFIX, self.sheet_id))
+        _SHEET_CONFIG_CACHE.clear()
+
+    def get_available_sheets(self, force_refresh: bool = False) -> List[str]:
         """
         Google Sheets에서 사용 가능한 시트명 목록을 가져옵니다.
 
-        Note: Google Apps Script의 제한으로 인해 직접적인 시트 목록 조회는 어렵습니다.
-        대신 일반적인 시트명들을 테스트해서 존재 여부를 확인합니다.
+        Apps Script의 get_sheet_names 액션으로 전체 시트 목록을 한 번에 조회한 뒤
+        후보 시트명과 비교합니다. 서버가 이 액션을 지원하지 않으면
+        일반적인 시트명들을 하나씩 테스트해서 존재 여부를 확인합니다.
+        결과는 로컬에 캐시되어 TTL(기본 1시간) 동안 재사용됩니다.
+
+        Args:
+            force_refresh: True이면 캐시를 무시하고 다시 감지
         """
-        # 우선순위가 높은 시트명들 (가장 가능성이 높은 것부터)
-        priority_sheet_names = [
-            '시트1', 'Sheet1', 'Sheet 1'
-        ]
+        if not force_refresh:
+            # 이미 감지한 결과가 있으면 재사용
+            if self.available_sheets:
+                return self.available_sheets
+
+            cached = self._load_cache()
+            if cached is not None:
+                self.available_sheets = cached
+                logger.info(f"캐시된 시트 목록 사용: {cached}")
+                return cached
+        else:
+            self._probe_cache.clear()
+
+        logger.info("사용 가능한 시트명 검색 중...")
 
-        # 추가로 확인할 시트명들
-        additional_sheet_names = [
-            'Main', '메인', 'Data', '데이터',
-            'Summary', '요약', '분석',
-            '메인데이터', '상위성과', '피벗테이블'
-        ]
+        # 시트 목록을 한 번의 요청으로 조회
+        result = self.client.get_sheet_names(self.sheet_id)
+        sheet_names = result.get('sheet_names')
 
-        available_sheets = []
+        if sheet_names is not None:
+            existing = set(sheet_names)
 
-        logger.info("사용 가능한 시트명 검색 중...")
+            # 전체 목록을 받았으므로 후보 시트들의 존재 여부가 모두 확정됨
+            for name in self.PRIORITY_SHEETS + self.ADDITIONAL_SHEETS:
+                self._probe_cache[name] = name in existing
+            self._probe_cache.update(dict.fromkeys(existing, True))
 
-        # 먼저 우선순위 높은 시트들 확인
-        for sheet_name in priority_sheet_names:
-            try:
-                # 시트에 읽기 시도
-                result = self.client.read_sheet(self.sheet_id, sheet_name)
-
-                if result.get('success') or 'Worksheet not found' not in result.get('error', ''):
-                    available_sheets.append(sheet_name)
-                    logger.info(f"  ✅ 발견: '{sheet_name}'")
-                    # 첫 번째 시트를 찾으면 빠르게 종료 (기본 시트가 있다면 충분)
-                    if len(available_sheets) >= 1:
-                        break
-                else:
-                    logger.debug(f"  ❌ 없음: '{sheet_name}'")
+            # 기본 시트는 첫 번째 하나면 충분
+            available_sheets = [name for name in self.PRIORITY_SHEETS if name in existing][:1]
+
+            # 기본 시트를 찾지 못했을 경우에만 추가 시트들 사용
+            if not available_sheets:
+                available_sheets = [name for name in self.ADDITIONAL_SHEETS if name in existing]
+
+            for sheet_name in available_sheets:
+                logger.info(f"  ✅ 발견: '{sheet_name}'")
+        else:
+            logger.info(f"시트 목록 조회 실패 ({result.get('error')}), 개별 시트 확인으로 대체")
+            available_sheets = self._probe_sheet_names()
+
+        self.available_sheets = available_sheets
+        logger.info(f"총 {len(available_sheets)}개 시트 발견: {available_sheets}")
+
+        # 발견된 경우에만 캐시 (일시적 오류로 빈 결과가 고정되지 않도록)
+        if available_sheets:
+            self._save_cache(available_sheets)
+
+        return available_sheets
+
+    def _probe_sheet_names(self) -> List[str]:
+        """
+        시트명 후보를 읽어서 존재 여부 확인 (get_sheet_names 미지원 서버용)
 
-            except Exception as e:
-                logger.debug(f"  ❌ 오류: '{sheet_name}' - {str(e)}")
-                continue
+        후보들은 독립적인 요청이므로 client.read_sheets로 병렬 확인합니다.
+        """
+        # 먼저 우선순위 높은 시트들 확인 (발견된 것 중 우선순위가 가장 높은 하나만 사용)
+        available_sheets = self._probe_parallel(self.PRIORITY_SHEETS)[:1]
 
         # 기본 시트를 찾지 못했을 경우에만 추가 시트들 확인
         if not available_sheets:
             logger.info("기본 시트를 찾지 못했습니다. 추가 시트명 확인 중...")
-            for sheet_name in additional_sheet_names:
-                try:
-                    result = self.client.read_sheet(self.sheet_id, sheet_name)
+            available_sheets = self._probe_parallel(self.ADDITIONAL_SHEETS)
 
-                    if result.get('success') or 'Worksheet not found' not in result.get('error', ''):
-                        available_sheets.append(sheet_name)
-                        logger.info(f"  ✅ 발견: '{sheet_name}'")
-                    else:
-                        logger.debug(f"  ❌ 없음: '{sheet_name}'")
+        return available_sheets
 
-                except Exception as e:
-                    logger.debug(f"  ❌ 오류: '{sheet_name}' - {str(e)}")
-                    continue
+    def _probe_parallel(self, sheet_names: Sequence[str]) -> List[str]:
+        """
+        시트명 목록을 병렬로 읽어 존재하는 시트명만 원래 순서대로 반환
 
-        self.available_sheets = available_sheets
-        logger.info(f"총 {len(available_sheets)}개 시트 발견: {available_sheets}")
+        이미 확인된 시트명은 다시 요청하지 않습니다.
+        success: true 응답만 존재로 판단하며, 일시적 오류는 캐시하지 않습니다.
+        """
+        unknown = [name for name in sheet_names if name not in self._probe_cache]
+        results = self.client.read_sheets(
+            [(self.sheet_id, name) for name in unknown], meta_only=True
+        )
+
+        for sheet_name, result in zip(unknown, results):
+            if result.get('success') is True:
+                self._probe_cache[sheet_name] = True
+            elif 'Worksheet not found' in result.get('error', ''):
+                self._probe_cache[sheet_name] = False
+            else:
+                logger.debug(f"  ⚠️ 확인 실패: '{sheet_name}' - {result.get('error')}")
 
-        return available_sheets
+        found = []
+        for sheet_name in sheet_names:
+            if self._probe_cache.get(sheet_name):
+                found.append(sheet_name)
+                logger.info(f"  ✅ 발견: '{sheet_name}'")
+            else:
+                logger.debug(f"  ❌ 없음: '{sheet_name}'")
+
+        return found
 
-    def create_smart_mapping(self) -> Dict[str, str]:
+    def create_smart_mapping(self, force_refresh: bool = False) -> Dict[str, str]:
         """
         발견된 시트들을 기반으로 스마트 매핑 생성
 
+        Args:
+            force_refresh: True이면 기존 매핑과 시트 목록을 무시하고 다시 감지
+
         Returns:
             시트 용도별 매핑 딕셔너리
         """
-        if not self.available_sheets:
-            self.get_available_sheets()
+        if self.sheet_mapping and not force_refresh:
+            return self.sheet_mapping
+
+        self.get_available_sheets(force_refresh)
 
         mapping = {
             'main_data': None,
@@ -117,29 +293,11 @@ class SheetsDetector:
             'pivot_table': None
         }
 
-        # 우선순위 기반 매핑
+        # 우선순위 기반 매핑 (시트명당 한 번의 정규식 탐색으로 모든 용도 판별)
         for sheet_name in self.available_sheets:
-            sheet_lower = sheet_name.lower()
-
-            # 메인 데이터 시트 매핑
-            if mapping['main_data'] is None:
-                if any(keyword in sheet_lower for keyword in ['sheet1', '시트1', 'main', '메인', 'data', '데이터', '메인데이터']):
-                    mapping['main_data'] = sheet_name
-
-            # 요약 시트 매핑
-            if mapping['summary'] is None:
-                if any(keyword in sheet_lower for keyword in ['summary', '요약', '분석']):
-                    mapping['summary'] = sheet_name
-
-            # 상위 성과 시트 매핑
-            if mapping['top_performers'] is None:
-                if any(keyword in sheet_lower for keyword in ['top', '상위', '성과', 'performer', 'ranking', '랭킹']):
-                    mapping['top_performers'] = sheet_name
-
-            # 피벗 테이블 시트 매핑
-            if mapping['pivot_table'] is None:
-                if any(keyword in sheet_lower for keyword in ['pivot', '피벗', 'table', '테이블']):
-                    mapping['pivot_table'] = sheet_name
+            for purpose in match_sheet_purposes(sheet_name):
+                if mapping[purpose] is None:
+                    mapping[purpose] = sheet_name
 
         # 매핑되지 않은 용도에 대해 기본값 설정
         main_sheet = self.available_sheets[0] if self.available_sheets else 'Sheet1'
@@ -169,19 +327,26 @@ class SheetsDetector:
         """
         logger.info(f"시트 접근 테스트: '{sheet_name}'")
 
+        # 이미 없는 것으로 확인된 시트는 요청하지 않음
+        if self._probe_cache.get(sheet_name) is False:
+            return {
+                'exists': False,
+                'readable': False,
+                'writable': False,
+                'error': 'Sheet not found'
+            }
+
         try:
-            # 읽기 테스트
-            read_result = self.client.read_sheet(self.sheet_id, sheet_name)
+            # 읽기 테스트 (쓰기 가능 여부도 시트 보호 설정 기준으로 함께 반환됨)
+            read_result = self.client.read_sheet(self.sheet_id, sheet_name, meta_only=True)
 
             if read_result.get('success'):
-                # 쓰기 테스트 (빈 데이터로)
-                test_data = [['테스트', '데이터']]
-                write_result = self.client.append_rows(self.sheet_id, test_data, sheet_name)
-
+                self._probe_cache[sheet_name] = True
                 return {
                     'exists': True,
                     'readable': True,
-                    'writable': write_result.get('success', False),
+                    # writable 필드가 없는 구버전 Apps Script는 쓰기 가능으로 간주
+                    'writable': read_result.get('writable', True),
                     'rows': read_result.get('rows', 0),
                     'columns': read_result.get('columns', 0),
                     'error': None
@@ -189,6 +354,11 @@ class SheetsDetector:
             else:
                 error_msg = read_result.get('error', '')
                 if 'Worksheet not found' in error_msg:
+                    self._probe_cache[sheet_name] = False
+                    # 있다고 알고 있던 시트가 사라진 경우에만 캐시가 낡은 것이므로 무효화
+                    # (create_missing_sheets처럼 없을 수도 있는 시트를 확인하는 경우는 제외)
+                    if sheet_name in self.available_sheets:
+                        self.invalidate_cache()
                     return {
                         'exists': False,
                         'readable': False,
@@ -224,11 +394,21 @@ class SheetsDetector:
         Returns:
             생성 결과 (실제로는 안내 메시지)
         """
-        missing_sheets = []
+        # 존재 여부가 이미 확인된 시트는 건너뛰고, 나머지 접근 테스트는 병렬 수행
+        unknown = [name for name in required_sheets if name not in self._probe_cache]
+        if unknown:
+            with ThreadPoolExecutor(max_workers=min(8, len(unknown))) as executor:
+                test_results = dict(zip(unknown, executor.map(self.test_sheet_access, unknown)))
+        else:
+            test_results = {}
 
+        missing_sheets = []
         for sheet_name in required_sheets:
-            test_result = self.test_sheet_access(sheet_name)
-            if not test_result['exists']:
+            exists = self._probe_cache.get(sheet_name)
+            if exists is None:
+                # 일시적 오류로 확정되지 않은 경우 접근 테스트 결과 사용
+                exists = test_results[sheet_name]['exists']
+            if not exists:
                 missing_sheets.append(sheet_name)
 
         if missing_sheets:
@@ -241,15 +421,17 @@ class SheetsDetector:
 
         return {sheet: True for sheet in required_sheets}
 
-    def get_recommended_config(self) -> Dict[str, str]:
+    def get_recommended_config(self, force_refresh: bool = False) -> Dict[str, str]:
         """
         추천 시트 설정 반환
 
+        Args:
+            force_refresh: True이면 캐시된 감지 결과를 무시하고 다시 감지
+
         Returns:
             추천 설정 딕셔너리
         """
-        self.get_available_sheets()
-        mapping = self.create_smart_mapping()
+        mapping = self.create_smart_mapping(force_refresh)
 
         # 사용자 친화적인 설정 생성
         config = {
@@ -266,7 +448,9 @@ class SheetsDetector:
         print("\n📊 Google Sheets 상태 분석")
         print("=" * 50)
 
-        available_sheets = self.get_available_sheets()
+        # 시트 감지는 추천 설정 계산 시 한 번만 수행
+        config = self.get_recommended_config()
+        available_sheets = self.available_sheets
 
         if available_sheets:
             print(f"✅ 발견된 시트 ({len(available_sheets)}개):")
@@ -280,27 +464,46 @@ class SheetsDetector:
             print("❌ 접근 가능한 시트를 찾을 수 없습니다.")
 
         print("\n🎯 추천 설정:")
-        config = self.get_recommended_config()
         for purpose, sheet_name in config.items():
             print(f"  {purpose}: '{sheet_name}'")
 
 
-def detect_sheets_auto() -> Dict[str, str]:
+def get_detected_sheet_config(web_app_url: str = None, sheet_id: str = None) -> Optional[Dict[str, str]]:
+    """
+    detect_sheets_auto가 실제로 시트를 찾아 캐시한 설정 반환
+
+    Returns:
+        감지에 성공한 설정 (감지 전이거나 실패/기본값 사용 시 None)
+    """
+    config = _SHEET_CONFIG_CACHE.get((web_app_url, sheet_id))
+    return dict(config) if config is not None else None
+
+
+def detect_sheets_auto(web_app_url: str = None, sheet_id: str = None) -> Dict[str, str]:
     """
     자동으로 시트 감지하고 설정 반환하는 헬퍼 함수
 
+    Args:
+        web_app_url: Apps Script 웹 앱 URL (없으면 환경변수 사용)
+        sheet_id: Google Sheets ID (없으면 환경변수 사용)
+
     Returns:
         시트 설정 딕셔너리
     """
+    # 같은 웹 앱 URL/시트 ID는 프로세스 안에서 한 번만 감지
+    key = (web_app_url, sheet_id)
+    if key in _SHEET_CONFIG_CACHE:
+        return dict(_SHEET_CONFIG_CACHE[key])
+
     try:
-        detector = SheetsDetector()
-        return detector.get_recommended_config()
+        detector = SheetsDetector(web_app_url, sheet_id)
+        config = detector.get_recommended_config()
+
+        # 시트를 실제로 찾은 경우에만 캐시 (일시적 오류로 인한 기본값이 고정되지 않도록)
+        if detector.available_sheets:
+            _SHEET_CONFIG_CACHE[key] = dict(config)
+        return config
     except Exception as e:
         logger.error(f"시트 자동 감지 실패: {str(e)}")
         # 기본값 반환
-        return {
-            'main_data_sheet': 'Sheet1',
-            'summary_sheet': 'Sheet1',
-            'top_performers_sheet': 'Sheet1',
-            'pivot_table_sheet': 'Sheet1'
-        }
\ No newline at end of file
+        return dict(DEFAULT_SHEET_CONFIG)
\ No newline at end of file
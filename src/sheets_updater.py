@@ -4,10 +4,12 @@ Appsflyer 처리된 데이터를 Google Sheets에 자동 업로드
 """
 
 import os
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 from datetime import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # 기존 sheets_client import
@@ -20,6 +22,50 @@ logger = logging.getLogger(__name__)
 # 환경변수 로드
 load_dotenv()
 
+# 시트 출력 시 소수점 2자리로 표시할 비용 컬럼과 소수점 1자리 %로 표시할 비율 컬럼
+COST_COLUMNS = ['cost', 'cpc', 'cpi', 'd1_retained_cac', 'cost_per_signup']
+PERCENT_COLUMNS = ['ctr', 'd1_retention_rate']
+
+# 감지된 시트 설정 캐시 유효 시간 기본값 (초, 환경변수 SHEET_CONFIG_TTL로 변경)
+SHEET_CONFIG_TTL = 3600
+
+# sheet_config에 키가 없을 때 사용할 기본 시트명
+DEFAULT_SHEET_NAMES = {
+    'main_data_sheet': 'Sheet1',
+    'summary_sheet': '요약',
+    'top_performers_sheet': '상위성과',
+    'pivot_table_sheet': '피벗테이블',
+}
+
+# 컬럼별 printf 형식 (np.char.mod로 배열 전체를 C 레벨에서 한 번에 포맷)
+# 목록에 없는 숫자 컬럼은 정수로 표시
+COLUMN_FORMATS = {
+    **{col: '%.2f' for col in COST_COLUMNS},
+    **{col: '%.1f%%' for col in PERCENT_COLUMNS},
+}
+
+# pandas 2.x: Copy-on-Write 활성화 (3.0부터는 기본 동작)
+# 복사본을 수정할 때 실제로 바뀐 컬럼만 복사되므로 방어적 전체 복사가 필요 없음
+if int(pd.__version__.split('.')[0]) == 2:
+    pd.set_option('mode.copy_on_write', True)
+
+
+def sheet_config_ttl() -> float:
+    """환경변수 SHEET_CONFIG_TTL(초) 조회 (잘못된 값이면 경고 후 기본값 사용)"""
+    value = os.getenv('SHEET_CONFIG_TTL')
+    if not value:
+        return SHEET_CONFIG_TTL
+
+    try:
+        ttl = float(value)
+    except ValueError:
+        ttl = -1.0
+
+    if not ttl >= 0:  # 음수/NaN 포함
+        logger.warning(f"잘못된 SHEET_CONFIG_TTL 값: {value!r}, 기본값 {SHEET_CONFIG_TTL}초 사용")
+        return SHEET_CONFIG_TTL
+    return ttl
+
 
 class SheetsUpdater:
     """Google Sheets 업데이트 관리 클래스"""
@@ -44,10 +90,37 @@ class SheetsUpdater:
         logger.info(f"감지된 시트 설정: {self.sheet_config}")
 
     def _detect_sheet_names(self) -> Dict[str, str]:
-        """시트명 자동 감지"""
+        """
+        시트명 자동 감지
+
+        감지 결과는 로컬 파일에 캐시되어 SHEET_CONFIG_TTL(초, 기본 3600) 동안 재사용됩니다.
+        감지에 실패하면 만료된 캐시라도 기본값보다 우선 사용합니다.
+        """
         try:
-            from sheets_detector import detect_sheets_auto
-            return detect_sheets_auto()
+            from sheets_detector import (
+                detect_sheets_auto, get_detected_sheet_config, cache_key, load_cache, save_cache,
+                SHEET_CONFIG_CACHE_PREFIX
+            )
+
+            cache_name = cache_key(SHEET_CONFIG_CACHE_PREFIX, self.sheet_id)
+            cached = load_cache(cache_name, sheet_config_ttl())
+            if cached is not None:
+                logger.info("캐시된 시트 설정 사용")
+                return cached
+
+            config = detect_sheets_auto(self.web_app_url, self.sheet_id)
+
+            if get_detected_sheet_config(self.web_app_url, self.sheet_id) is not None:
+                save_cache(cache_name, config)
+                return config
+
+            # 감지 실패: 만료된 캐시가 있으면 기본값 대신 사용
+            stale = load_cache(cache_name, float('inf'))
+            if stale is not None:
+                logger.warning("시트 자동 감지 실패, 이전에 캐시된 시트 설정 사용")
+                return stale
+
+            return config
         except Exception as e:
             logger.warning(f"시트 자동 감지 실패: {str(e)}, 기본값 사용")
             return {
@@ -106,38 +179,47 @@ class SheetsUpdater:
         if df.empty:
             return []
 
-        # DataFrame 복사본 생성
-        df_clean = df.copy()
+        # 원본을 변경하지 않는 얕은 사본 (Copy-on-Write로 수정되는 컬럼만 복사됨)
+        df_clean = df[df.columns]
 
         # Categorical 컬럼을 문자열로 변환
-        for col in df_clean.columns:
-            if pd.api.types.is_categorical_dtype(df_clean[col]):
-                df_clean[col] = df_clean[col].astype(str)
-
-        # NaN 값을 빈 문자열로 변경
-        df_clean = df_clean.fillna('')
-
-        # 무한대 값을 'N/A'로 변경
-        df_clean = df_clean.replace([float('inf'), float('-inf')], 'N/A')
-
-        # 숫자를 문자열로 변환 (소수점 2자리까지)
-        for col in df_clean.columns:
-            if df_clean[col].dtype in ['float64', 'int64']:
-                if col in ['cost', 'cpc', 'cpi', 'd1_retained_cac']:
-                    # 비용 관련은 소수점 2자리
-                    df_clean[col] = df_clean[col].apply(
-                        lambda x: f"{float(x):.2f}" if str(x) not in ['N/A', ''] else x
-                    )
-                elif col in ['ctr', 'd1_retention_rate']:
-                    # 퍼센트는 소수점 1자리
-                    df_clean[col] = df_clean[col].apply(
-                        lambda x: f"{float(x):.1f}%" if str(x) not in ['N/A', ''] else x
-                    )
-                else:
-                    # 정수형은 소수점 없이
-                    df_clean[col] = df_clean[col].apply(
-                        lambda x: str(int(float(x))) if str(x) not in ['N/A', ''] else x
-                    )
+        # 고유값(categories)만 한 번 문자열로 만들고 정수 코드로 펼침 (NaN 코드 -1은 빈 문자열)
+        for col in df_clean.select_dtypes(include='category').columns:
+            labels = np.append(df_clean[col].cat.categories.astype(str).to_numpy(dtype=object), '')
+            df_clean[col] = labels[df_clean[col].cat.codes.to_numpy()]
+
+        # 숫자를 문자열로 변환 (NaN/inf가 문자열로 바뀌기 전, 숫자형일 때 벡터 연산으로 처리)
+        # float32/uint8 등 축소된 숫자형도 포함 (bool 제외)
+        num_cols = df_clean.select_dtypes(include=[np.integer, np.floating]).columns
+
+        for col in num_cols:
+            # 이미 float64인 컬럼은 복사 없이 원본 배열을 그대로 사용
+            values = df_clean[col].to_numpy(dtype=float, copy=False)
+            finite = np.isfinite(values)
+
+            fmt = COLUMN_FORMATS.get(col)
+            if fmt is not None:
+                # 비용은 소수점 2자리, 퍼센트는 소수점 1자리
+                formatted = np.char.mod(fmt, values[finite])
+            else:
+                # 정수형은 소수점 없이
+                formatted = values[finite].astype(np.int64).astype(str)
+
+            # 같은 배열에서 NaN은 빈 문자열, 무한대는 'N/A'로 채움
+            column = np.empty(len(values), dtype=object)
+            column[finite] = formatted
+            column[np.isnan(values)] = ''
+            column[np.isinf(values)] = 'N/A'
+            df_clean[col] = column
+
+        # 나머지(문자열 등) 컬럼: NaN 값은 빈 문자열, 무한대 값은 'N/A'로 변경
+        other_cols = df_clean.columns.difference(num_cols, sort=False)
+        if len(other_cols):
+            df_clean[other_cols] = (
+                df_clean[other_cols]
+                .fillna('')
+                .replace([float('inf'), float('-inf')], 'N/A')
+            )
 
         # 헤더 + 데이터로 변환
         headers = list(df_clean.columns)
@@ -147,28 +229,31 @@ class SheetsUpdater:
 
     def create_summary_sheet_data(self, stats: Dict) -> List[List]:
         """요약 통계를 시트용 데이터로 변환"""
+        updated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        media_dist = stats.get('media_distribution', {})
+        platform_dist = stats.get('platform_distribution', {})
+
         summary_data = [
             ['항목', '값'],
             ['총 콘텐츠 수', str(stats.get('total_contents', 0))],
             ['총 비용', f"${stats.get('total_cost', 0):,.2f}"],
             ['총 설치 수', f"{stats.get('total_installs', 0):,}"],
             ['평균 D1 Retained CAC', f"${stats.get('avg_d1_retained_cac', 0):.2f}"],
-            ['업데이트 시간', datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
+            ['업데이트 시간', updated_at]
         ]
 
+        # 분포 데이터가 없으면 빈 섹션 헤더를 쓰지 않음
         # 매체별 분포
-        summary_data.append(['', ''])  # 빈 줄
-        summary_data.append(['매체별 분포', ''])
-        media_dist = stats.get('media_distribution', {})
-        for media, count in media_dist.items():
-            summary_data.append([f'  {media}', str(count)])
+        if media_dist:
+            summary_data.append(['', ''])  # 빈 줄
+            summary_data.append(['매체별 분포', ''])
+            summary_data.extend([f'  {media}', str(count)] for media, count in media_dist.items())
 
         # 플랫폼별 분포
-        summary_data.append(['', ''])  # 빈 줄
-        summary_data.append(['플랫폼별 분포', ''])
-        platform_dist = stats.get('platform_distribution', {})
-        for platform, count in platform_dist.items():
-            summary_data.append([f'  {platform}', str(count)])
+        if platform_dist:
+            summary_data.append(['', ''])  # 빈 줄
+            summary_data.append(['플랫폼별 분포', ''])
+            summary_data.extend([f'  {platform}', str(count)] for platform, count in platform_dist.items())
 
         return summary_data
 
@@ -176,112 +261,97 @@ class SheetsUpdater:
         """상위 성과 콘텐츠를 시트용 데이터로 변환"""
         top_performers = stats.get('top_performers', [])
 
-        if not top_performers:
+        # 레코드 목록과 컬럼별 배열(dict of arrays) 형식 모두 DataFrame으로 변환
+        top_df = pd.DataFrame(top_performers).head(10)  # 상위 10개만
+
+        if top_df.empty:
             return [['상위 성과 콘텐츠 없음']]
 
         headers = ['순위', '콘텐츠명', '매체', '플랫폼', '등급', 'D1 Retained CAC']
-        data_rows = []
-
-        for i, performer in enumerate(top_performers[:10], 1):  # 상위 10개만
-            row = [
-                str(i),
-                performer.get('content_name', ''),
-                performer.get('media_type', ''),
-                performer.get('platform_normalized', ''),
-                performer.get('performance_grade', ''),
-                f"${performer.get('d1_retained_cac', 0):.2f}" if performer.get('d1_retained_cac') not in [float('inf'), 'N/A'] else 'N/A'
-            ]
-            data_rows.append(row)
-
-        return [headers] + data_rows
-
-    def update_main_data_sheet(self, df: pd.DataFrame, sheet_name: str = None) -> Dict[str, Any]:
-        """메인 데이터를 Google Sheets에 업데이트"""
-        if sheet_name is None:
-            sheet_name = self.sheet_config['main_data_sheet']
-        logger.info(f"메인 데이터 시트 업데이트 시작: {sheet_name}")
 
-        # 시트 존재 확인 및 생성
-        if not self.ensure_sheet_exists(sheet_name):
-            return {'success': False, 'error': f'시트 {sheet_name} 생성 실패'}
+        # D1 Retained CAC: 유한한 값만 $ 표시, inf/NaN/'N/A'는 'N/A' (컬럼이 없으면 0으로 간주)
+        if 'd1_retained_cac' in top_df.columns:
+            cac = pd.to_numeric(top_df['d1_retained_cac'], errors='coerce').to_numpy(dtype=float)
+        else:
+            cac = np.zeros(len(top_df))
+        finite = np.isfinite(cac)
+        cac_text = np.where(finite, np.char.mod('$%.2f', np.where(finite, cac, 0.0)), 'N/A')
 
-        # 데이터 준비
-        sheet_data = self.prepare_data_for_sheets(df)
+        top_df = top_df.reindex(
+            columns=['content_name', 'media_type', 'platform_normalized', 'performance_grade'],
+            fill_value=''
+        )
+        top_df['d1_retained_cac'] = cac_text
 
-        if not sheet_data:
-            logger.warning("업데이트할 데이터가 없습니다.")
-            return {'success': False, 'error': '데이터 없음'}
+        top_df.insert(0, '순위', [str(i) for i in range(1, len(top_df) + 1)])
 
-        try:
-            # 시트 덮어쓰기
-            result = self.client.overwrite_sheet(self.sheet_id, sheet_data, sheet_name)
+        return [headers] + top_df.values.tolist()
 
-            if result.get('success'):
-                logger.info(f"메인 데이터 업데이트 성공: {len(sheet_data)}행")
-                return {'success': True, 'rows': len(sheet_data), 'columns': len(sheet_data[0])}
-            else:
-                logger.error(f"메인 데이터 업데이트 실패: {result.get('error')}")
-                return result
+    def _sheet_name(self, config_key: str) -> str:
+        """설정된 시트명 조회 (설정에 없으면 기본 시트명)"""
+        return self.sheet_config.get(config_key, DEFAULT_SHEET_NAMES[config_key])
 
-        except Exception as e:
-            logger.error(f"메인 데이터 업데이트 중 오류: {str(e)}")
-            return {'success': False, 'error': str(e)}
+    def _update_sheet(self, config_key: str, label: str, builder: Callable[[Any], List[List]],
+                      arg: Any, sheet_name: str = None) -> Dict[str, Any]:
+        """
+        시트 데이터를 생성해 덮어쓰는 공통 업데이트 처리
 
-    def update_summary_sheet(self, stats: Dict, sheet_name: str = None) -> Dict[str, Any]:
-        """요약 통계를 Google Sheets에 업데이트"""
+        Args:
+            config_key: sheet_config의 시트 키 (sheet_name이 없을 때 사용)
+            label: 로그에 표시할 시트 이름
+            builder: arg를 받아 시트용 2차원 리스트를 만드는 함수
+            arg: builder에 전달할 데이터 (DataFrame 또는 통계 dict)
+            sheet_name: 대상 시트명 (None이면 설정값 사용)
+        """
         if sheet_name is None:
-            sheet_name = self.sheet_config.get('summary_sheet', '요약')
-        logger.info(f"요약 시트 업데이트 시작: {sheet_name}")
+            sheet_name = self._sheet_name(config_key)
+        logger.info(f"{label} 시트 업데이트 시작: {sheet_name}")
 
         # 시트 존재 확인 및 생성
         if not self.ensure_sheet_exists(sheet_name):
             return {'success': False, 'error': f'시트 {sheet_name} 생성 실패'}
 
         try:
-            # 요약 데이터 생성
-            summary_data = self.create_summary_sheet_data(stats)
+            # 데이터 준비
+            sheet_data = builder(arg)
+
+            if not sheet_data:
+                logger.warning(f"{label}: 업데이트할 데이터가 없습니다.")
+                return {'success': False, 'error': '데이터 없음'}
 
-            # 시트 덮어쓰기
-            result = self.client.overwrite_sheet(self.sheet_id, summary_data, sheet_name)
+            # 시트 덮어쓰기 (OVERWRITE_CHUNK_ROWS를 넘는 데이터는 클라이언트가 청크 단위로 나눠 전송)
+            result = self.client.overwrite_sheet(self.sheet_id, sheet_data, sheet_name)
 
             if result.get('success'):
-                logger.info(f"요약 시트 업데이트 성공: {len(summary_data)}행")
-                return {'success': True, 'rows': len(summary_data)}
+                logger.info(f"{label} 업데이트 성공: {len(sheet_data)}행")
+                return {'success': True, 'rows': len(sheet_data), 'columns': len(sheet_data[0])}
             else:
-                logger.error(f"요약 시트 업데이트 실패: {result.get('error')}")
+                logger.error(f"{label} 업데이트 실패: {result.get('error')}")
                 return result
 
         except Exception as e:
-            logger.error(f"요약 시트 업데이트 중 오류: {str(e)}")
+            logger.error(f"{label} 업데이트 중 오류: {str(e)}")
             return {'success': False, 'error': str(e)}
 
-    def update_top_performers_sheet(self, stats: Dict, sheet_name: str = None) -> Dict[str, Any]:
-        """상위 성과 콘텐츠를 Google Sheets에 업데이트"""
-        if sheet_name is None:
-            sheet_name = self.sheet_config.get('top_performers_sheet', '상위성과')
-        logger.info(f"상위 성과 시트 업데이트 시작: {sheet_name}")
-
-        # 시트 존재 확인 및 생성
-        if not self.ensure_sheet_exists(sheet_name):
-            return {'success': False, 'error': f'시트 {sheet_name} 생성 실패'}
-
-        try:
-            # 상위 성과 데이터 생성
-            top_data = self.create_top_performers_data(stats)
+    def update_main_data_sheet(self, df: pd.DataFrame, sheet_name: str = None) -> Dict[str, Any]:
+        """메인 데이터를 Google Sheets에 업데이트"""
+        return self._update_sheet('main_data_sheet', '메인 데이터', self.prepare_data_for_sheets,
+                                  df, sheet_name)
 
-            # 시트 덮어쓰기
-            result = self.client.overwrite_sheet(self.sheet_id, top_data, sheet_name)
+    def update_summary_sheet(self, stats: Dict, sheet_name: str = None) -> Dict[str, Any]:
+        """요약 통계를 Google Sheets에 업데이트"""
+        return self._update_sheet('summary_sheet', '요약', self.create_summary_sheet_data,
+                                  stats, sheet_name)
 
-            if result.get('success'):
-                logger.info(f"상위 성과 시트 업데이트 성공: {len(top_data)}행")
-                return {'success': True, 'rows': len(top_data)}
-            else:
-                logger.error(f"상위 성과 시트 업데이트 실패: {result.get('error')}")
-                return result
+    def update_top_performers_sheet(self, stats: Dict, sheet_name: str = None) -> Dict[str, Any]:
+        """상위 성과 콘텐츠를 Google Sheets에 업데이트"""
+        return self._update_sheet('top_performers_sheet', '상위 성과', self.create_top_performers_data,
+                                  stats, sheet_name)
 
-        except Exception as e:
-            logger.error(f"상위 성과 시트 업데이트 중 오류: {str(e)}")
-            return {'success': False, 'error': str(e)}
+    def update_pivot_sheet(self, df: pd.DataFrame, sheet_name: str = None) -> Dict[str, Any]:
+        """피벗 테이블을 Google Sheets에 업데이트"""
+        return self._update_sheet('pivot_table_sheet', '피벗 테이블', self.create_pivot_table_data,
+                                  df, sheet_name)
 
     def create_pivot_table_data(self, df: pd.DataFrame) -> List[List]:
         """피벗 테이블 형태의 데이터 생성"""
@@ -300,18 +370,24 @@ class SheetsUpdater:
                 logger.warning("피벗 테이블 생성에 필요한 컬럼이 부족합니다.")
                 return [['피벗 테이블 생성 불가 - 필요한 컬럼 없음']]
 
-            # 피벗 테이블 생성
+            # 필요한 컬럼만 잘라서 사용하고, 그룹 키는 category로 변환해 정수 코드로 그룹화
+            sub = df[available_pivot_cols + [value_column]].astype(
+                {col: 'category' for col in available_pivot_cols}
+            )
+
+            # 피벗 테이블 생성 (실제로 나타난 조합만 사용)
             if len(available_pivot_cols) == 2:
-                pivot_df = df.pivot_table(
+                pivot_df = sub.pivot_table(
                     values=value_column,
                     index=available_pivot_cols[0],
                     columns=available_pivot_cols[1],
                     aggfunc='mean',
-                    fill_value=0
+                    fill_value=0,
+                    observed=True
                 )
             else:
                 # 1차원 그룹화
-                pivot_df = df.groupby(available_pivot_cols[0])[value_column].mean().to_frame()
+                pivot_df = sub.groupby(available_pivot_cols[0], observed=True)[value_column].mean().to_frame()
 
             # 피벗 테이블을 리스트 형태로 변환
             pivot_data = []
@@ -324,17 +400,13 @@ class SheetsUpdater:
 
             pivot_data.append(header)
 
-            # 데이터 추가
-            for index, row in pivot_df.iterrows():
-                row_data = [str(index)]
-                for value in row:
-                    if value == 0:
-                        row_data.append('N/A')
-                    elif isinstance(value, (int, float)):
-                        row_data.append(f"${value:.2f}")
-                    else:
-                        row_data.append(str(value))
-                pivot_data.append(row_data)
+            # 데이터 추가: 값이 있는 칸만 $ 표시, 0(조합 없음)과 NaN/inf는 'N/A'
+            values = pivot_df.to_numpy(dtype=float)
+            valid = np.isfinite(values) & (values != 0)
+            cells = np.where(valid, np.char.mod('$%.2f', np.where(valid, values, 0.0)), 'N/A')
+            pivot_data.extend(
+                [str(index)] + row for index, row in zip(pivot_df.index, cells.tolist())
+            )
 
             return pivot_data
 
@@ -342,51 +414,37 @@ class SheetsUpdater:
             logger.error(f"피벗 테이블 생성 중 오류: {str(e)}")
             return [['피벗 테이블 생성 중 오류 발생', str(e)]]
 
-    def update_pivot_sheet(self, df: pd.DataFrame, sheet_name: str = None) -> Dict[str, Any]:
-        """피벗 테이블을 Google Sheets에 업데이트"""
-        if sheet_name is None:
-            sheet_name = self.sheet_config.get('pivot_table_sheet', '피벗테이블')
-        logger.info(f"피벗 테이블 시트 업데이트 시작: {sheet_name}")
-
-        # 시트 존재 확인 및 생성
-        if not self.ensure_sheet_exists(sheet_name):
-            return {'success': False, 'error': f'시트 {sheet_name} 생성 실패'}
-
-        try:
-            # 피벗 데이터 생성
-            pivot_data = self.create_pivot_table_data(df)
-
-            # 시트 덮어쓰기
-            result = self.client.overwrite_sheet(self.sheet_id, pivot_data, sheet_name)
-
-            if result.get('success'):
-                logger.info(f"피벗 테이블 업데이트 성공: {len(pivot_data)}행")
-                return {'success': True, 'rows': len(pivot_data)}
-            else:
-                logger.error(f"피벗 테이블 업데이트 실패: {result.get('error')}")
-                return result
-
-        except Exception as e:
-            logger.error(f"피벗 테이블 업데이트 중 오류: {str(e)}")
-            return {'success': False, 'error': str(e)}
-
     def update_all_sheets(self, df: pd.DataFrame, stats: Dict) -> Dict[str, Any]:
         """모든 시트를 일괄 업데이트"""
         logger.info("전체 시트 업데이트 시작")
 
-        results = {}
+        # (결과 키, 대상 시트명, 업데이트 함수) - 메인 데이터, 요약, 상위 성과, 피벗 테이블 순
+        tasks = [
+            ('main_data', self._sheet_name('main_data_sheet'),
+             lambda: self.update_main_data_sheet(df)),
+            ('summary', self._sheet_name('summary_sheet'),
+             lambda: self.update_summary_sheet(stats)),
+            ('top_performers', self._sheet_name('top_performers_sheet'),
+             lambda: self.update_top_performers_sheet(stats)),
+            ('pivot_table', self._sheet_name('pivot_table_sheet'),
+             lambda: self.update_pivot_sheet(df)),
+        ]
 
-        # 1. 메인 데이터 업데이트
-        results['main_data'] = self.update_main_data_sheet(df)
+        # 서로 다른 시트는 병렬로 업데이트 (HTTP 대기 시간이 대부분이므로 스레드로 충분)
+        # 같은 시트를 대상으로 하는 작업은 동시 쓰기를 피하기 위해 원래 순서대로 묶어서 실행
+        groups: Dict[str, List] = {}
+        for name, sheet_name, update in tasks:
+            groups.setdefault(sheet_name, []).append((name, update))
 
-        # 2. 요약 시트 업데이트
-        results['summary'] = self.update_summary_sheet(stats)
+        def run_group(group):
+            return [(name, update()) for name, update in group]
 
-        # 3. 상위 성과 시트 업데이트
-        results['top_performers'] = self.update_top_performers_sheet(stats)
+        group_results = {}
+        with ThreadPoolExecutor(max_workers=min(4, len(groups))) as executor:
+            for finished in executor.map(run_group, groups.values()):
+                group_results.update(finished)
 
-        # 4. 피벗 테이블 업데이트
-        results['pivot_table'] = self.update_pivot_sheet(df)
+        results = {name: group_results[name] for name, _, _ in tasks}
 
         # 전체 성공 여부 판단
         all_success = all(result.get('success', False) for result in results.values())
@@ -452,6 +510,7 @@ def create_sheets_config_template():
             'cpc': '${:.2f}',
             'cpi': '${:.2f}',
             'd1_retained_cac': '${:.2f}',
+            'cost_per_signup': '${:.2f}',
             'ctr': '{:.1f}%',
             'd1_retention_rate': '{:.1f}%'
         },
@@ -7,19 +7,29 @@ import requests
 import json
 from typing import List, Dict, Any, Optional
 
+from sheets_client import create_session, decode_json, post_json
+
+# 이 크기(바이트)를 넘는 POST 본문은 gzip 압축해서 전송
+GZIP_MIN_BYTES = 64000
+
 
 class TokenAuthSheetsClient:
     """토큰 인증을 사용하는 Google Sheets 클라이언트"""
 
-    def __init__(self, web_app_url: str, access_token: str):
+    def __init__(self, web_app_url: str, access_token: str,
+                 compress_min_bytes: Optional[int] = GZIP_MIN_BYTES):
         """
         Args:
             web_app_url: Apps Script 웹 앱 URL
             access_token: 접근 토큰
+            compress_min_bytes: 이 크기를 넘는 POST 본문은 gzip 압축 (None이면 압축 안 함)
         """
         self.web_app_url = web_app_url
         self.access_token = access_token
-        self.session = requests.Session()
+        self.compress_min_bytes = compress_min_bytes
+        # 연결 풀 + 전송 계층 재시도 (429/5xx, Retry-After 준수)
+        self.session = create_session(pool_size=8, retries=5, backoff_factor=0.5)
+        self.session.headers.update({'Content-Type': 'application/json'})
 
     def read_sheet(self, sheet_id: str, sheet_name: str = 'Sheet1') -> Dict[str, Any]:
         """스프레드시트 데이터 읽기"""
@@ -32,7 +42,7 @@ class TokenAuthSheetsClient:
         try:
             response = self.session.get(self.web_app_url, params=params)
             response.raise_for_status()
-            return response.json()
+            return decode_json(response.content)
         except requests.exceptions.RequestException as e:
             return {'error': f'Request failed: {str(e)}'}
         except json.JSONDecodeError as e:
@@ -96,13 +106,10 @@ class TokenAuthSheetsClient:
     def _post_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """POST 요청 헬퍼 메서드"""
         try:
-            response = self.session.post(
-                self.web_app_url,
-                data=json.dumps(payload),
-                headers={'Content-Type': 'application/json'}
+            result, self.compress_min_bytes = post_json(
+                self.session, self.web_app_url, payload, self.compress_min_bytes, level=3
             )
-            response.raise_for_status()
-            return response.json()
+            return result
         except requests.exceptions.RequestException as e:
             return {'error': f'Request failed: {str(e)}'}
         except json.JSONDecodeError as e:
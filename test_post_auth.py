@@ -8,6 +8,19 @@ import requests
 import json
 from dotenv import load_dotenv
 
+try:
+    import orjson
+
+    def dumps(payload) -> bytes:
+        return orjson.dumps(payload)
+
+    loads = orjson.loads
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    def dumps(payload) -> bytes:
+        return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+    loads = json.loads
+
 # 환경변수 로드
 load_dotenv()
 
@@ -62,7 +75,7 @@ def test_post_with_auth():
         try:
             response = requests.post(
                 webapp_url,
-                data=json.dumps(payload),
+                data=dumps(payload),
                 headers=test_case['headers'],
                 timeout=30,
                 allow_redirects=True
@@ -73,7 +86,7 @@ def test_post_with_auth():
 
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = loads(response.content)
                     if data.get('success'):
                         print(f"   ✅ 성공: {data}")
                     else:
@@ -109,7 +122,7 @@ def test_get_vs_post():
         print(f"   GET 상태 코드: {response.status_code}")
         if response.status_code == 200:
             try:
-                data = response.json()
+                data = loads(response.content)
                 print(f"   GET 성공: {data.get('success', False)}")
             except:
                 print(f"   GET JSON 파싱 실패")
@@ -130,14 +143,14 @@ def test_get_vs_post():
     try:
         response = requests.post(
             webapp_url,
-            data=json.dumps(payload),
+            data=dumps(payload),
             headers={'Content-Type': 'application/json'},
             timeout=30
         )
         print(f"   POST 상태 코드: {response.status_code}")
         if response.status_code == 200:
             try:
-                data = response.json()
+                data = loads(response.content)
                 print(f"   POST 성공: {data.get('success', False)}")
             except:
                 print(f"   POST JSON 파싱 실패")